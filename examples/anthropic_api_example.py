@@ -8,14 +8,24 @@ creating function calling capabilities that can be used by Claude.
 Requirements:
 - speechlab_mcp package installed
 - anthropic Python package installed
+- cachetools package installed
+- httpx with HTTP/2 support installed (pip install 'httpx[http2]')
 - ANTHROPIC_API_KEY environment variable set
 - SPEECHLAB_API_KEY environment variable set
 """
 
 import os
+import sys
 import json
+import random
+import asyncio
+import inspect
+import typing
+import functools
+import cachetools
+import httpx
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import anthropic
 from anthropic.types import MessageParam
 
@@ -27,18 +37,70 @@ from speechlab_mcp.server import (
     upload_media,
     start_dubbing,
     check_dubbing_status,
-    download_dubbing_result
+    download_dubbing_result,
+    mcp
 )
 from mcp.types import TextContent
 
 # Load environment variables
 load_dotenv()
 
+# Share one keep-alive connection pool across all Claude calls so the
+# tool-result round-trip (and every REPL turn) reuses the same connection
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0
+    ),
+    http2=True,
+    timeout=httpx.Timeout(60.0, connect=10.0)
+)
+
 # Initialize the Anthropic client
-client = anthropic.Anthropic(
-    api_key=os.environ.get("ANTHROPIC_API_KEY")
+client = anthropic.AsyncAnthropic(
+    api_key=os.environ.get("ANTHROPIC_API_KEY"),
+    http_client=http_client
 )
 
+MODEL = "claude-3-opus-20240229"
+
+# Abort a streamed response if no chunk arrives within this many seconds
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Exponential backoff bounds (seconds) when polling a message batch
+BATCH_POLL_BASE_DELAY = 2.0
+BATCH_POLL_MAX_DELAY = 60.0
+
+# Sent through the system parameter, since the Messages API only accepts user
+# and assistant turns in messages
+SYSTEM_PROMPT = "You are an assistant that helps users with video dubbing using Speechlab. You have access to tools that let you create dubbing projects, upload media, start dubbing processes, and download results."
+
+# Maximum number of a single turn's tool calls that hit the Speechlab API at once
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Short-lived cache for the read-only tools, so repeated lookups within one
+# reasoning turn skip the network. Cleared whenever a tool changes a project.
+_read_cache = cachetools.TTLCache(maxsize=256, ttl=30)
+
+def _cached_tool(tool):
+    """Wrap a read-only Speechlab tool so its results are cached."""
+    @functools.wraps(tool)
+    async def wrapper(**parameters) -> TextContent:
+        key = (tool.__name__, cachetools.keys.hashkey(**parameters))
+        result = _read_cache.get(key)
+        if result is None:
+            result = _read_cache[key] = await tool(**parameters)
+        return result
+    return wrapper
+
+cached_get_projects = _cached_tool(get_projects)
+cached_get_project = _cached_tool(get_project)
+
+def invalidate_read_cache() -> None:
+    """Drop cached project lookups after a mutating tool call."""
+    _read_cache.clear()
+
 # Function to convert TextContent to a dictionary
 def text_content_to_dict(response: TextContent) -> Dict[str, Any]:
     """Convert TextContent to a dictionary for Anthropic API."""
@@ -47,165 +109,210 @@ def text_content_to_dict(response: TextContent) -> Dict[str, Any]:
     
     return {"text": response.text}
 
-# Define the tools that will be available to Claude
-TOOLS = [
-    {
-        "name": "create_project_and_dub",
-        "description": "Create a new dubbing project with Speechlab",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "Name of the project"
-                },
-                "source_language": {
-                    "type": "string",
-                    "description": "Source language code (e.g., 'en' for English)"
-                },
-                "target_language": {
-                    "type": "string",
-                    "description": "Target language code (e.g., 'es' for Spanish)"
-                }
-            },
-            "required": ["name", "source_language", "target_language"]
-        }
-    },
-    {
-        "name": "get_projects",
-        "description": "Get a list of projects from Speechlab",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of projects to retrieve (default: 10)"
-                }
-            }
-        }
-    },
-    {
-        "name": "get_project",
-        "description": "Get details of a specific project by ID",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "ID of the project to retrieve"
-                }
-            },
-            "required": ["project_id"]
-        }
-    },
-    {
-        "name": "upload_media",
-        "description": "Upload a media file to an existing project",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "ID of the project to upload to"
-                },
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to the media file to upload"
-                }
-            },
-            "required": ["project_id", "file_path"]
-        }
-    },
-    {
-        "name": "start_dubbing",
-        "description": "Start the dubbing process for a project",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "ID of the project to start dubbing"
-                }
-            },
-            "required": ["project_id"]
-        }
-    },
-    {
-        "name": "check_dubbing_status",
-        "description": "Check the status of a dubbing job for a project",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "ID of the project to check"
-                }
-            },
-            "required": ["project_id"]
-        }
-    },
-    {
-        "name": "download_dubbing_result",
-        "description": "Download a completed dubbing result",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "ID of the project to download the result for"
-                },
-                "output_directory": {
-                    "type": "string",
-                    "description": "Directory to save the downloaded file (optional)"
-                }
-            },
-            "required": ["project_id"]
-        }
-    }
-]
+# Map Python parameter types to JSON schema types
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+
+def _json_schema_type(annotation: Any) -> Dict[str, Any]:
+    """Convert a parameter annotation to a JSON schema fragment."""
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+        # Optional[X] is expressed by leaving the parameter out of "required"
+        return _json_schema_type(args[0])
+    if typing.get_origin(annotation) in (list, List):
+        return {"type": "array", "items": _json_schema_type(args[0])}
+    return {"type": _JSON_TYPES.get(annotation, "string")}
+
+def _parse_description(description: str) -> Tuple[str, Dict[str, str]]:
+    """Split a tool description into its summary line and per-argument descriptions."""
+    lines = inspect.cleandoc(description).splitlines()
+    arg_descriptions = {}
+    current = None
+    in_args = False
+    for line in lines[1:]:
+        if line.strip() == "Args:":
+            in_args = True
+        elif in_args and line.startswith("        ") and current:
+            arg_descriptions[current] += " " + line.strip()
+        elif in_args and line.startswith("    ") and ":" in line:
+            current, _, text = line.strip().partition(":")
+            arg_descriptions[current] = text.strip()
+        elif line.strip():
+            in_args = False
+    return lines[0].strip(), arg_descriptions
+
+def build_tool_schema(fn: Any, description: str) -> Dict[str, Any]:
+    """
+    Build an Anthropic tool definition from a Speechlab tool function.
+    
+    Args:
+        fn: The tool function; its signature supplies names, types and defaults
+        description: The tool's MCP description; supplies the summary line and
+            argument descriptions
+        
+    Returns:
+        Tool definition for the Anthropic messages API
+    """
+    summary, arg_descriptions = _parse_description(description)
+    hints = typing.get_type_hints(fn)
+    properties = {}
+    required = []
+    for name, param in inspect.signature(fn).parameters.items():
+        prop = _json_schema_type(hints.get(name, str))
+        if name in arg_descriptions:
+            prop["description"] = arg_descriptions[name]
+        properties[name] = prop
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+    
+    schema = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = required
+    return {"name": fn.__name__, "description": summary, "input_schema": schema}
+
+# The Speechlab tools exposed to Claude
+TOOL_FUNCTIONS = (
+    create_project_and_dub,
+    get_projects,
+    get_project,
+    upload_media,
+    start_dubbing,
+    check_dubbing_status,
+    download_dubbing_result,
+)
+
+# Tool definitions sent to Claude, built on first use by get_tools
+_tools: Optional[List[Dict[str, Any]]] = None
+
+async def get_tools() -> List[Dict[str, Any]]:
+    """
+    Get the tools that will be available to Claude.
+    
+    They are generated once from the tool signatures and the descriptions
+    registered with the MCP server, so the two can't drift apart. This is
+    done on first use rather than at import, so the example can be imported
+    from code that is already running an event loop.
+    
+    Returns:
+        Tool definitions for the Messages API
+    """
+    global _tools
+    if _tools is None:
+        descriptions = {tool.name: tool.description for tool in await mcp.list_tools()}
+        tools = [build_tool_schema(fn, descriptions[fn.__name__]) for fn in TOOL_FUNCTIONS]
+        
+        # The tool definitions are identical on every request, so mark the end
+        # of them as a prompt-cache breakpoint; later turns reuse the cached
+        # prefix instead of having it re-processed
+        tools[-1]["cache_control"] = {"type": "ephemeral"}
+        _tools = tools
+    return _tools
+
+# Map tool names to the functions that implement them
+_TOOL_TABLE = {
+    "create_project_and_dub": create_project_and_dub,
+    "get_projects": cached_get_projects,
+    "get_project": cached_get_project,
+    "upload_media": upload_media,
+    "start_dubbing": start_dubbing,
+    "check_dubbing_status": check_dubbing_status,
+    "download_dubbing_result": download_dubbing_result,
+}
+
+# Tools that change project state and so invalidate the read cache
+_MUTATING_TOOLS = frozenset({"create_project_and_dub", "upload_media", "start_dubbing"})
 
 # Function to execute the tool calls
-def execute_tool_call(tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_tool_call(tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a tool call based on the name and parameters."""
+    fn = _TOOL_TABLE.get(tool_name)
+    if fn is None:
+        return {"text": f"Unknown tool: {tool_name}"}
+    
     try:
-        if tool_name == "create_project_and_dub":
-            response = create_project_and_dub(**parameters)
-            return text_content_to_dict(response)
-        
-        elif tool_name == "get_projects":
-            response = get_projects(**parameters)
-            return text_content_to_dict(response)
-        
-        elif tool_name == "get_project":
-            response = get_project(**parameters)
-            return text_content_to_dict(response)
-        
-        elif tool_name == "upload_media":
-            response = upload_media(**parameters)
-            return text_content_to_dict(response)
-        
-        elif tool_name == "start_dubbing":
-            response = start_dubbing(**parameters)
-            return text_content_to_dict(response)
-        
-        elif tool_name == "check_dubbing_status":
-            response = check_dubbing_status(**parameters)
-            return text_content_to_dict(response)
+        response = await fn(**parameters)
+        if tool_name in _MUTATING_TOOLS:
+            invalidate_read_cache()
+        return text_content_to_dict(response)
+    except Exception as e:
+        return {"text": f"Error executing {tool_name}: {str(e)}"}
+
+async def stream_message(messages: List[MessageParam]) -> Tuple[str, Any]:
+    """
+    Stream a Claude response to stdout as tokens arrive.
+    
+    Args:
+        messages: List of messages to send to Claude
         
-        elif tool_name == "download_dubbing_result":
-            response = download_dubbing_result(**parameters)
-            return text_content_to_dict(response)
+    Returns:
+        Tuple of the accumulated response text and the final message
+    """
+    chunks = []
+    
+    async with client.messages.stream(
+        model=MODEL,
+        max_tokens=1024,
+        system=SYSTEM_PROMPT,
+        messages=messages,
+        tools=await get_tools()
+    ) as stream:
+        events = stream.__aiter__()
+        while True:
+            # Dead-man timer: give up if the stream goes quiet, since httpx
+            # read timeouts are not reliable on every platform. Any event
+            # resets it, so tool_use input and pauses between text blocks
+            # don't count as silence.
+            try:
+                event = await asyncio.wait_for(events.__anext__(), STREAM_IDLE_TIMEOUT)
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"No response chunk received in {STREAM_IDLE_TIMEOUT:.0f}s")
+            if event.type == "text":
+                sys.stdout.write(event.text)
+                sys.stdout.flush()
+                chunks.append(event.text)
+        final_message = await stream.get_final_message()
+    
+    return "".join(chunks), final_message
+
+async def run_tool_calls(tool_calls: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Execute a turn's tool calls concurrently.
+    
+    Args:
+        tool_calls: tool_use content blocks from a Claude message
         
-        else:
-            return {"text": f"Unknown tool: {tool_name}"}
+    Returns:
+        tool_result content blocks, in the same order as tool_calls
+    """
+    for tool_call in tool_calls:
+        print(f"\nExecuting tool call: {tool_call.name} with parameters: {tool_call.input}")
     
-    except Exception as e:
-        return {"text": f"Error executing {tool_name}: {str(e)}"}
+    # Run the tool calls concurrently, a bounded number at a time; gather
+    # preserves the call order
+    slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+    
+    async def run_one(tool_call: Any) -> Dict[str, Any]:
+        async with slots:
+            return await execute_tool_call(tool_call.name, tool_call.input)
+    
+    results = await asyncio.gather(*[run_one(tc) for tc in tool_calls])
+    return [
+        {
+            "type": "tool_result",
+            "tool_use_id": tool_call.id,
+            "content": json.dumps(result)
+        }
+        for tool_call, result in zip(tool_calls, results)
+    ]
 
-def process_user_message(messages: List[MessageParam]) -> str:
+async def process_user_message(messages: List[MessageParam]) -> str:
     """
     Process a user message with Claude and handle any tool calls.
     
+    The response is streamed to stdout as it is generated, and multiple
+    tool calls in one turn are executed concurrently.
+    
     Args:
         messages: List of previous messages in the conversation
         
@@ -213,102 +320,182 @@ def process_user_message(messages: List[MessageParam]) -> str:
         Claude's response text
     """
     # Call Claude with the messages and available tools
-    response = client.messages.create(
-        model="claude-3-opus-20240229",
-        max_tokens=1024,
-        messages=messages,
-        tools=TOOLS
-    )
+    text, response = await stream_message(messages)
     
     # Check if Claude wants to call a tool
-    if response.content and hasattr(response.content[0], 'tool_calls') and response.content[0].tool_calls:
-        # Process each tool call
-        tool_results = []
-        for tool_call in response.content[0].tool_calls:
-            tool_name = tool_call.name
-            parameters = json.loads(tool_call.input)
-            
-            print(f"Executing tool call: {tool_name} with parameters: {parameters}")
-            result = execute_tool_call(tool_name, parameters)
-            tool_results.append({
-                "tool_call_id": tool_call.id,
-                "output": json.dumps(result)
-            })
+    tool_calls = [block for block in response.content if block.type == "tool_use"]
+    if tool_calls:
+        tool_results = await run_tool_calls(tool_calls)
         
         # Send the tool results back to Claude
-        final_response = client.messages.create(
-            model="claude-3-opus-20240229",
-            max_tokens=1024,
-            messages=messages + [response],
-            tool_results=tool_results
+        final_text, _ = await stream_message(
+            messages + [
+                {"role": "assistant", "content": response.content},
+                {"role": "user", "content": tool_results}
+            ]
         )
         
         # Return the final response
-        if final_response.content:
-            return final_response.content[0].text
-        else:
-            return "No response from Claude after tool execution."
+        return final_text or "No response from Claude after tool execution."
     
     # If no tool calls, just return the response
-    if response.content:
-        return response.content[0].text
-    else:
-        return "No response from Claude."
+    return text or "No response from Claude."
 
-if __name__ == "__main__":
-    import argparse
+async def wait_for_batch(batch_id: str) -> Any:
+    """
+    Poll a message batch with exponential backoff until it has ended.
     
-    parser = argparse.ArgumentParser(description="Speechlab MCP Anthropic API Integration Example")
-    parser.add_argument("--query", help="User query to process", default=None)
-    args = parser.parse_args()
+    Args:
+        batch_id: ID of the message batch
+        
+    Returns:
+        The ended message batch
+    """
+    attempt = 0
+    while True:
+        batch = await client.messages.batches.retrieve(batch_id)
+        if batch.ended_at is not None:
+            return batch
+        delay = min(BATCH_POLL_MAX_DELAY, BATCH_POLL_BASE_DELAY * 2 ** attempt) * (0.5 + random.random())
+        print(f"Batch {batch_id} is {batch.processing_status}; checking again in {delay:.0f}s...")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+async def process_batch(queries: List[str]) -> List[str]:
+    """
+    Process independent queries through the Message Batches API.
     
-    # Example conversation
-    conversation = [
-        {
-            "role": "system",
-            "content": "You are an assistant that helps users with video dubbing using Speechlab. You have access to tools that let you create dubbing projects, upload media, start dubbing processes, and download results."
-        }
-    ]
+    Batches cost half as much as regular requests but may take much longer
+    to complete, so this is only used for non-interactive runs. Queries that
+    call tools are resubmitted with the tool results in a follow-up batch.
     
-    if not args.query:
-        print("Running interactive mode. Type 'exit' to quit.")
-        print("Example commands:")
-        print("- Create a dubbing project called 'Product Demo' in English with Spanish dubbing")
-        print("- List all my dubbing projects")
-        print("- Check the status of project abc123")
-        print("- Upload my video at /path/to/video.mp4 to project abc123")
-        print("- Download the result for project abc123")
+    Args:
+        queries: User queries, each answered in its own conversation
         
-        while True:
-            user_input = input("\nEnter your request: ")
-            if user_input.lower() in ["exit", "quit"]:
-                break
-                
-            # Add the user message to the conversation
-            conversation.append({
-                "role": "user",
-                "content": user_input
-            })
+    Returns:
+        Claude's response text for each query, in order
+    """
+    conversations = {
+        f"query-{i}": [{"role": "user", "content": query}]
+        for i, query in enumerate(queries)
+    }
+    answers = {}
+    pending = dict(conversations)
+    tools = await get_tools()
+    
+    while pending:
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": MODEL,
+                        "max_tokens": 1024,
+                        "system": SYSTEM_PROMPT,
+                        "messages": messages,
+                        "tools": tools
+                    }
+                }
+                for custom_id, messages in pending.items()
+            ]
+        )
+        print(f"Submitted batch {batch.id} with {len(pending)} request(s)")
+        await wait_for_batch(batch.id)
+        
+        next_pending = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                answers[entry.custom_id] = f"Batch request {entry.result.type}."
+                continue
             
-            try:
-                # Process the message with Claude
-                response = process_user_message(conversation)
-                print(f"\nClaude response:\n{response}")
-                
-                # Add Claude's response to the conversation history
+            message = entry.result.message
+            tool_calls = [block for block in message.content if block.type == "tool_use"]
+            if tool_calls:
+                tool_results = await run_tool_calls(tool_calls)
+                next_pending[entry.custom_id] = pending[entry.custom_id] + [
+                    {"role": "assistant", "content": message.content},
+                    {"role": "user", "content": tool_results}
+                ]
+            else:
+                text = "".join(block.text for block in message.content if block.type == "text")
+                answers[entry.custom_id] = text or "No response from Claude."
+        pending = next_pending
+    
+    return [answers[custom_id] for custom_id in conversations]
+
+async def main(queries: Optional[List[str]] = None, batch: bool = False):
+    """Run the given queries, or an interactive session if none are given."""
+    # Example conversation
+    conversation = []
+    
+    try:
+        if not queries:
+            print("Running interactive mode. Type 'exit' to quit.")
+            print("Example commands:")
+            print("- Create a dubbing project called 'Product Demo' in English with Spanish dubbing")
+            print("- List all my dubbing projects")
+            print("- Check the status of project abc123")
+            print("- Upload my video at /path/to/video.mp4 to project abc123")
+            print("- Download the result for project abc123")
+            
+            loop = asyncio.get_running_loop()
+            while True:
+                # Read stdin in a worker thread so the event loop is not blocked
+                user_input = await loop.run_in_executor(None, input, "\nEnter your request: ")
+                if user_input.lower() in ["exit", "quit"]:
+                    break
+                    
+                # Add the user message to the conversation
                 conversation.append({
-                    "role": "assistant",
-                    "content": response
+                    "role": "user",
+                    "content": user_input
                 })
-            except Exception as e:
-                print(f"Error: {e}")
-    else:
-        # Add the user query to the conversation
-        conversation.append({
-            "role": "user",
-            "content": args.query
-        })
-        
-        # Process the message with Claude
-        response = process_user_message(conversation)
-        print(response) 
\ No newline at end of file
+                
+                try:
+                    # Process the message with Claude, streaming the reply
+                    print("\nClaude response:")
+                    response = await process_user_message(conversation)
+                    print()
+                    
+                    # Add Claude's response to the conversation history
+                    conversation.append({
+                        "role": "assistant",
+                        "content": response
+                    })
+                except Exception as e:
+                    print(f"Error: {e}")
+        elif batch:
+            # Latency doesn't matter here, so trade it for batch pricing
+            responses = await process_batch(queries)
+            for query, response in zip(queries, responses):
+                print(f"\n> {query}\n{response}")
+        else:
+            for query in queries:
+                # Each query is answered in its own conversation
+                messages = conversation + [{
+                    "role": "user",
+                    "content": query
+                }]
+                
+                # Process the message with Claude, streaming the reply
+                await process_user_message(messages)
+                print()
+    finally:
+        await http_client.aclose()
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Speechlab MCP Anthropic API Integration Example")
+    parser.add_argument("--query", action="append", help="User query to process (may be repeated)", default=None)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit the queries through the Message Batches API (cheaper, but slower)"
+    )
+    args = parser.parse_args()
+    
+    if args.batch and not args.query:
+        parser.error("--batch requires at least one --query")
+    
+    asyncio.run(main(args.query, args.batch))
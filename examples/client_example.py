@@ -11,7 +11,7 @@ Requirements:
 """
 
 import os
-import time
+import asyncio
 import logging
 import argparse
 from pathlib import Path
@@ -29,6 +29,9 @@ logger = logging.getLogger("speechlab-client-example")
 # Load environment variables
 load_dotenv()
 
+# Extensions of video formats Speechlab is known to accept
+_VALID_EXT = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.m4v'})
+
 def status_callback(attempt, project_data):
     """
     Callback function for status updates.
@@ -45,7 +48,9 @@ def status_callback(attempt, project_data):
     # - Logging to a database
     # - Triggering other processes
     
-    logger.info(f"Status update (attempt {attempt+1}): {status}")
+    # Called on every poll, so skip building the record when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Status update (attempt %d): %s", attempt+1, status)
 
 def validate_file(file_path):
     """
@@ -60,19 +65,21 @@ def validate_file(file_path):
     if not file_path:
         raise ValueError("No file path provided")
     
-    path = Path(file_path).expanduser().absolute()
+    path = os.path.abspath(os.path.expanduser(file_path))
     
-    if not path.exists():
+    try:
+        os.stat(path)
+    except FileNotFoundError:
         raise ValueError(f"File does not exist: {path}")
     
     # Simple extension check
-    valid_extensions = ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.m4v']
-    if path.suffix.lower() not in valid_extensions:
-        logger.warning(f"Warning: File extension {path.suffix} might not be a supported video format")
+    extension = os.path.splitext(path)[1]
+    if extension.lower() not in _VALID_EXT:
+        logger.warning("Warning: File extension %s might not be a supported video format", extension)
     
-    return str(path)
+    return path
 
-def run_dubbing_workflow(
+async def run_dubbing_workflow(
     video_path,
     project_name,
     source_language,
@@ -96,33 +103,33 @@ def run_dubbing_workflow(
     Returns:
         Dict with workflow results
     """
-    logger.info(f"Starting dubbing workflow for video: {video_path}")
+    logger.info("Starting dubbing workflow for video: %s", video_path)
     
     # Validate input file
     try:
         validated_path = validate_file(video_path)
-        logger.info(f"Validated video file: {validated_path}")
+        logger.info("Validated video file: %s", validated_path)
     except ValueError as e:
-        logger.error(f"File validation error: {e}")
+        logger.error("File validation error: %s", e)
         return {"status": "ERROR", "message": str(e)}
     
     # Create directory for output if needed
     if output_dir:
         output_path = Path(output_dir).expanduser().absolute()
         output_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory: {output_path}")
+        logger.info("Output directory: %s", output_path)
     else:
         output_path = Path.home() / "Downloads"
-        logger.info(f"Using default output directory: {output_path}")
+        logger.info("Using default output directory: %s", output_path)
     
     # Initialize client
     try:
-        with SpeechlabClient(api_key=api_key, base_url=base_url) as client:
+        async with SpeechlabClient(api_key=api_key, base_url=base_url) as client:
             results = {}
             
             # 1. Create project
-            logger.info(f"Creating project '{project_name}' ({source_language} → {target_language})")
-            project = client.create_project(
+            logger.info("Creating project '%s' (%s → %s)", project_name, source_language, target_language)
+            project = await client.create_project(
                 name=project_name,
                 source_language=source_language,
                 target_language=target_language
@@ -132,11 +139,11 @@ def run_dubbing_workflow(
                 raise ValueError("Failed to get project ID from response")
             
             results["project_id"] = project_id
-            logger.info(f"Project created successfully! ID: {project_id}")
+            logger.info("Project created successfully! ID: %s", project_id)
             
             # 2. Upload media
-            logger.info(f"Uploading video: {validated_path}")
-            upload_result = client.upload_media(
+            logger.info("Uploading video: %s", validated_path)
+            upload_result = await client.upload_media(
                 project_id=project_id,
                 file_path=validated_path
             )
@@ -144,12 +151,12 @@ def run_dubbing_workflow(
             
             # 3. Start dubbing
             logger.info("Starting dubbing process...")
-            dub_result = client.start_dubbing(project_id=project_id)
+            dub_result = await client.start_dubbing(project_id=project_id)
             logger.info("Dubbing process started successfully!")
             
             # 4. Wait for completion
             logger.info("Waiting for dubbing to complete...")
-            completion = client.wait_for_completion(
+            completion = await client.wait_for_completion(
                 project_id=project_id,
                 max_attempts=30,
                 delay_seconds=20,
@@ -162,25 +169,25 @@ def run_dubbing_workflow(
                 
                 # 5. Generate sharing link
                 logger.info("Generating sharing link...")
-                sharing_link = client.generate_sharing_link(project_id=project_id)
+                sharing_link = await client.generate_sharing_link(project_id=project_id)
                 results["sharing_link"] = sharing_link
-                logger.info(f"Sharing link: {sharing_link}")
+                logger.info("Sharing link: %s", sharing_link)
                 
                 # 6. Download the result
-                logger.info(f"Downloading result to {output_path}...")
-                download_path = client.download_result(
+                logger.info("Downloading result to %s...", output_path)
+                download_path = await client.download_result(
                     project_id=project_id,
                     output_directory=str(output_path)
                 )
                 results["output_file"] = download_path
-                logger.info(f"Downloaded to: {download_path}")
+                logger.info("Downloaded to: %s", download_path)
             else:
                 logger.error("Dubbing did not complete within the expected time.")
                 results["status"] = "TIMEOUT"
             
             return results
     except Exception as e:
-        logger.exception(f"Error in dubbing workflow: {e}")
+        logger.exception("Error in dubbing workflow: %s", e)
         return {"status": "ERROR", "message": str(e)}
 
 def main():
@@ -195,7 +202,7 @@ def main():
     
     args = parser.parse_args()
     
-    result = run_dubbing_workflow(
+    result = asyncio.run(run_dubbing_workflow(
         video_path=args.video,
         project_name=args.name,
         source_language=args.source,
@@ -203,7 +210,7 @@ def main():
         output_dir=args.output,
         api_key=args.api_key,
         base_url=args.api_url
-    )
+    ))
     
     if result["status"] == "COMPLETE":
         print("\n✅ Dubbing workflow completed successfully!")
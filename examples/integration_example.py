@@ -11,7 +11,9 @@ Requirements:
 """
 
 import os
-import time
+import re
+import asyncio
+import random
 import logging
 from dotenv import load_dotenv
 from speechlab_mcp.server import (
@@ -19,7 +21,7 @@ from speechlab_mcp.server import (
     get_project,
     upload_media,
     start_dubbing,
-    check_dubbing_status,
+    get_dubbing_status,
     download_dubbing_result,
     generate_sharing_link
 )
@@ -39,49 +41,60 @@ API_KEY = os.getenv("SPEECHLAB_API_KEY")
 if not API_KEY:
     raise ValueError("SPEECHLAB_API_KEY environment variable is required")
 
+# Patterns for pulling fields out of the tools' text responses
+_ID_RE = re.compile(r'^ID:\s*(\S+)', re.MULTILINE)
+
 def extract_project_id(text_content: TextContent) -> str:
     """Extract project ID from a TextContent response."""
     # Parse the ID from the response text
-    for line in text_content.text.split('\n'):
-        if line.startswith("ID:"):
-            return line.split("ID:")[1].strip()
-    return None
+    match = _ID_RE.search(text_content.text)
+    return match.group(1) if match else None
 
-def wait_for_completion(project_id: str, max_attempts: int = 20, delay: int = 15) -> bool:
+async def wait_for_completion(
+    project_id: str,
+    max_attempts: int = 20,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0
+) -> bool:
     """
     Poll the project status until it completes or exceeds max attempts.
     
+    The wait between checks grows exponentially from base_delay up to
+    max_delay, with jitter so concurrent workers don't poll in lockstep.
+    
     Args:
         project_id: The project ID to check
         max_attempts: Maximum number of status checks
-        delay: Seconds to wait between checks
+        base_delay: Base wait after the first check, before jitter
+        max_delay: Upper bound on the wait between checks
         
     Returns:
         True if project completed successfully, False otherwise
     """
-    logger.info(f"Waiting for project {project_id} to complete...")
+    logger.info("Waiting for project %s to complete...", project_id)
     
     for attempt in range(max_attempts):
-        logger.info(f"Checking status (attempt {attempt+1}/{max_attempts})...")
-        response = check_dubbing_status(project_id)
+        logger.info("Checking status (attempt %d/%d)...", attempt+1, max_attempts)
+        status = await get_dubbing_status(project_id)
         
         # Look for completion or failure indicators in the status
-        if "Status: COMPLETE" in response.text:
+        if status["status"] == "COMPLETE":
             logger.info("Project completed successfully!")
             return True
-        elif "Status: FAILED" in response.text:
+        elif status["status"] == "FAILED":
             logger.error("Project processing failed!")
             return False
             
         # Continue waiting if still in progress
-        logger.info(f"Project still processing. Current status: {response.text}")
-        logger.info(f"Waiting {delay} seconds before next check...")
-        time.sleep(delay)
+        delay = min(max_delay, base_delay * 2 ** attempt * (0.5 + random.random()))
+        logger.info("Project still processing. Status: %s, progress: %s", status["status"], status["progress"])
+        logger.info("Waiting %.1f seconds before next check...", delay)
+        await asyncio.sleep(delay)
     
-    logger.warning(f"Maximum attempts ({max_attempts}) reached without completion")
+    logger.warning("Maximum attempts (%d) reached without completion", max_attempts)
     return False
 
-def run_example_workflow(video_path: str = None):
+async def run_example_workflow(video_path: str = None):
     """
     Run a complete example workflow from project creation to downloading results.
     
@@ -92,13 +105,13 @@ def run_example_workflow(video_path: str = None):
     
     # 1. Create a new project
     logger.info("Creating a new dubbing project...")
-    project_response = create_project_and_dub(
+    project_response = await create_project_and_dub(
         name="Integration Example",
         source_language="en",
         target_language="es",
         source_file=video_path  # Will be None if not provided
     )
-    logger.info(f"Project created: {project_response.text}")
+    logger.info("Project created: %s", project_response.text)
     
     # Extract the project ID
     project_id = extract_project_id(project_response)
@@ -108,27 +121,27 @@ def run_example_workflow(video_path: str = None):
     
     # 2. Upload media if not already uploaded during creation
     if video_path and "source_file" not in project_response.text.lower():
-        logger.info(f"Uploading video file: {video_path}")
-        upload_response = upload_media(project_id, video_path)
-        logger.info(f"Upload result: {upload_response.text}")
+        logger.info("Uploading video file: %s", video_path)
+        upload_response = await upload_media(project_id, video_path)
+        logger.info("Upload result: %s", upload_response.text)
     
     # 3. Start the dubbing process
     logger.info("Starting dubbing process...")
-    dub_response = start_dubbing(project_id)
-    logger.info(f"Dubbing started: {dub_response.text}")
+    dub_response = await start_dubbing(project_id)
+    logger.info("Dubbing started: %s", dub_response.text)
     
     # 4. Wait for the project to complete
-    if wait_for_completion(project_id):
+    if await wait_for_completion(project_id):
         # 5. Generate a sharing link
         logger.info("Generating sharing link...")
-        link_response = generate_sharing_link(project_id)
-        logger.info(f"Sharing link: {link_response.text}")
+        link_response = await generate_sharing_link(project_id)
+        logger.info("Sharing link: %s", link_response.text)
         
         # 6. Download the result
         logger.info("Downloading dubbed video...")
         download_dir = os.path.expanduser("~/Downloads")
-        download_response = download_dubbing_result(project_id, download_dir)
-        logger.info(f"Download result: {download_response.text}")
+        download_response = await download_dubbing_result(project_id, download_dir)
+        logger.info("Download result: %s", download_response.text)
         
         logger.info("Workflow completed successfully!")
     else:
@@ -141,4 +154,4 @@ if __name__ == "__main__":
     parser.add_argument("--video", help="Path to video file to process", default=None)
     args = parser.parse_args()
     
-    run_example_workflow(args.video) 
\ No newline at end of file
+    asyncio.run(run_example_workflow(args.video)) 
\ No newline at end of file
@@ -8,22 +8,21 @@ creating tools that can be used in a LangChain agent workflow.
 Requirements:
 - speechlab_mcp package installed
 - langchain and related packages installed
+- cachetools package installed
 - OpenAI API key or other LLM API key
 - SPEECHLAB_API_KEY environment variable set
 """
 
 import os
+import asyncio
+import cachetools
 from dotenv import load_dotenv
 from typing import Dict, Any, List
+from pydantic import BaseModel, Field
 
 # Load environment variables
 load_dotenv()
 
-# Import LangChain components
-from langchain.agents import AgentType, initialize_agent, Tool
-from langchain.memory import ConversationBufferMemory
-from langchain.chat_models import ChatOpenAI
-
 # Import Speechlab MCP components
 from speechlab_mcp.server import (
     create_project_and_dub,
@@ -37,129 +36,192 @@ from speechlab_mcp.server import (
 )
 from mcp.types import TextContent
 
-# Adapter functions to convert between MCP TextContent and plain text for LangChain
+# Adapter functions to convert between MCP TextContent and plain text for LangChain.
+# The Speechlab tools are coroutines, so the wrappers await them directly on
+# the agent's event loop.
 def adapt_to_langchain(response: TextContent) -> str:
     """Convert MCP TextContent response to string for LangChain."""
     return response.text if response and hasattr(response, 'text') else str(response)
 
-def create_project_tool(name: str, source_language: str, target_language: str) -> str:
+# Short-lived cache of converted tool output for the read-only tools, so the
+# agent re-listing or re-reading a project within one reasoning turn skips
+# both the network and the conversion. Cleared whenever a tool changes a project.
+_read_cache = cachetools.TTLCache(maxsize=256, ttl=30)
+
+async def _cached_call(tool_impl, **kwargs) -> str:
+    """Call a read-only Speechlab tool, memoizing its converted output."""
+    args_key = (tool_impl.__name__, tuple(sorted(kwargs.items())))
+    cached = _read_cache.get(args_key)
+    if cached is not None:
+        return cached
+    
+    result = adapt_to_langchain(await tool_impl(**kwargs))
+    _read_cache[args_key] = result
+    return result
+
+def invalidate_read_cache() -> None:
+    """Drop cached project lookups after a mutating tool call."""
+    _read_cache.clear()
+
+async def create_project_tool(name: str, source_language: str, target_language: str) -> str:
     """Create a new dubbing project."""
-    response = create_project_and_dub(
+    response = await create_project_and_dub(
         name=name,
         source_language=source_language,
         target_language=target_language
     )
+    invalidate_read_cache()
     return adapt_to_langchain(response)
 
-def get_projects_tool(limit: int = 10) -> str:
+async def get_projects_tool(limit: int = 10) -> str:
     """Get a list of projects."""
-    response = get_projects(limit=limit)
-    return adapt_to_langchain(response)
+    return await _cached_call(get_projects, limit=limit)
 
-def get_project_tool(project_id: str) -> str:
+async def get_project_tool(project_id: str) -> str:
     """Get details for a specific project."""
-    response = get_project(project_id=project_id)
-    return adapt_to_langchain(response)
+    return await _cached_call(get_project, project_id=project_id)
 
-def upload_media_tool(project_id: str, file_path: str) -> str:
+async def upload_media_tool(project_id: str, file_path: str) -> str:
     """Upload media to a project."""
-    response = upload_media(project_id=project_id, file_path=file_path)
+    response = await upload_media(project_id=project_id, file_path=file_path)
+    invalidate_read_cache()
     return adapt_to_langchain(response)
 
-def start_dubbing_tool(project_id: str) -> str:
+async def start_dubbing_tool(project_id: str) -> str:
     """Start the dubbing process for a project."""
-    response = start_dubbing(project_id=project_id)
+    response = await start_dubbing(project_id=project_id)
+    invalidate_read_cache()
     return adapt_to_langchain(response)
 
-def check_status_tool(project_id: str) -> str:
+async def check_status_tool(project_id: str) -> str:
     """Check the status of a dubbing process."""
-    response = check_dubbing_status(project_id=project_id)
+    response = await check_dubbing_status(project_id=project_id)
     return adapt_to_langchain(response)
 
-def download_result_tool(project_id: str, output_dir: str = "~/Downloads") -> str:
+async def download_result_tool(project_id: str, output_dir: str = "~/Downloads") -> str:
     """Download the dubbing result."""
-    response = download_dubbing_result(
+    response = await download_dubbing_result(
         project_id=project_id,
         output_directory=output_dir
     )
     return adapt_to_langchain(response)
 
-def generate_link_tool(project_id: str) -> str:
+async def generate_link_tool(project_id: str) -> str:
     """Generate a sharing link for a project."""
-    response = generate_sharing_link(project_id=project_id)
+    response = await generate_sharing_link(project_id=project_id)
     return adapt_to_langchain(response)
 
-# Create LangChain tools
-tools = [
-    Tool(
-        name="CreateDubbingProject",
-        func=create_project_tool,
-        description="Create a new dubbing project. Args: name, source_language, target_language"
-    ),
-    Tool(
-        name="ListProjects",
-        func=get_projects_tool,
-        description="List all available dubbing projects. Args: limit (optional)"
-    ),
-    Tool(
-        name="GetProjectDetails",
-        func=get_project_tool,
-        description="Get details about a specific project. Args: project_id"
-    ),
-    Tool(
-        name="UploadMedia",
-        func=upload_media_tool,
-        description="Upload a media file to a project. Args: project_id, file_path"
-    ),
-    Tool(
-        name="StartDubbing",
-        func=start_dubbing_tool,
-        description="Start the dubbing process for a project. Args: project_id"
-    ),
-    Tool(
-        name="CheckDubbingStatus",
-        func=check_status_tool,
-        description="Check the status of a dubbing job. Args: project_id"
-    ),
-    Tool(
-        name="DownloadDubbingResult",
-        func=download_result_tool,
-        description="Download the dubbed video. Args: project_id, output_dir (optional)"
-    ),
-    Tool(
-        name="GenerateSharingLink",
-        func=generate_link_tool,
-        description="Generate a sharing link for a project. Args: project_id"
-    )
-]
+# Argument schemas, so the LLM returns structured arguments directly
+class CreateProjectArgs(BaseModel):
+    name: str = Field(description="Name of the project")
+    source_language: str = Field(description="Source language code (e.g., 'en' for English)")
+    target_language: str = Field(description="Target language code (e.g., 'es' for Spanish)")
 
-# Setup the LLM
-llm = ChatOpenAI(temperature=0)
+class ListProjectsArgs(BaseModel):
+    limit: int = Field(10, description="Maximum number of projects to retrieve")
 
-# Setup memory
-memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
+class ProjectIdArgs(BaseModel):
+    project_id: str = Field(description="ID of the project")
 
-# Setup agent
-agent = initialize_agent(
-    tools=tools,
-    llm=llm,
-    agent=AgentType.CHAT_CONVERSATIONAL_REACT_DESCRIPTION,
-    memory=memory,
-    verbose=True
-)
+class UploadMediaArgs(BaseModel):
+    project_id: str = Field(description="ID of the project to upload to")
+    file_path: str = Field(description="Path to the media file to upload")
 
-def run_agent_with_query(query: str) -> str:
-    """Run the agent with a user query and return the response."""
-    return agent.run(input=query)
+class DownloadResultArgs(BaseModel):
+    project_id: str = Field(description="ID of the project to download the result for")
+    output_dir: str = Field("~/Downloads", description="Directory to save the downloaded file")
 
-if __name__ == "__main__":
-    import argparse
+def build_agent():
+    """
+    Build the LangChain agent with the Speechlab tools.
     
-    parser = argparse.ArgumentParser(description="Speechlab MCP LangChain Integration Example")
-    parser.add_argument("--query", help="User query to process", default=None)
-    args = parser.parse_args()
+    LangChain is imported here rather than at module level because it is
+    slow to import, and --help shouldn't have to pay for it.
+    """
+    from langchain.agents import AgentType, initialize_agent
+    from langchain.tools import StructuredTool
+    from langchain.memory import ConversationBufferMemory
+    from langchain.chat_models import ChatOpenAI
+    from langchain.prompts import MessagesPlaceholder
+    
+    # Create LangChain tools
+    tools = [
+        StructuredTool.from_function(
+            coroutine=create_project_tool,
+            name="CreateDubbingProject",
+            description="Create a new dubbing project.",
+            args_schema=CreateProjectArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=get_projects_tool,
+            name="ListProjects",
+            description="List all available dubbing projects.",
+            args_schema=ListProjectsArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=get_project_tool,
+            name="GetProjectDetails",
+            description="Get details about a specific project.",
+            args_schema=ProjectIdArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=upload_media_tool,
+            name="UploadMedia",
+            description="Upload a media file to a project.",
+            args_schema=UploadMediaArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=start_dubbing_tool,
+            name="StartDubbing",
+            description="Start the dubbing process for a project.",
+            args_schema=ProjectIdArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=check_status_tool,
+            name="CheckDubbingStatus",
+            description="Check the status of a dubbing job.",
+            args_schema=ProjectIdArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=download_result_tool,
+            name="DownloadDubbingResult",
+            description="Download the dubbed video.",
+            args_schema=DownloadResultArgs
+        ),
+        StructuredTool.from_function(
+            coroutine=generate_link_tool,
+            name="GenerateSharingLink",
+            description="Generate a sharing link for a project.",
+            args_schema=ProjectIdArgs
+        )
+    ]
     
-    if not args.query:
+    # Setup the LLM
+    llm = ChatOpenAI(temperature=0)
+    
+    # Setup memory
+    memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
+    
+    # Setup agent. The function-calling agent passes each tool's JSON schema to
+    # the model natively and supports multi-argument tools.
+    return initialize_agent(
+        tools=tools,
+        llm=llm,
+        agent=AgentType.OPENAI_FUNCTIONS,
+        agent_kwargs={"extra_prompt_messages": [MessagesPlaceholder(variable_name="chat_history")]},
+        memory=memory,
+        verbose=True
+    )
+
+async def run_agent_with_query(agent, query: str) -> str:
+    """Run the agent with a user query and return the response."""
+    return await agent.arun(input=query)
+
+async def main(query: str = None):
+    """Run a single query, or an interactive session if no query is given."""
+    agent = build_agent()
+    
+    if not query:
         print("Running interactive mode. Type 'exit' to quit.")
         print("Example commands:")
         print("- Create a dubbing project called 'Product Demo' in English with Spanish dubbing")
@@ -168,17 +230,28 @@ if __name__ == "__main__":
         print("- Upload my video at /path/to/video.mp4 to project abc123")
         print("- Download the result for project abc123")
         
+        loop = asyncio.get_running_loop()
         while True:
-            user_input = input("\nEnter your request: ")
+            # Read stdin in a worker thread so the event loop is not blocked
+            user_input = await loop.run_in_executor(None, input, "\nEnter your request: ")
             if user_input.lower() in ["exit", "quit"]:
                 break
                 
             try:
-                response = run_agent_with_query(user_input)
+                response = await run_agent_with_query(agent, user_input)
                 print(f"\nAgent response:\n{response}")
             except Exception as e:
                 print(f"Error: {e}")
     else:
         # Run with the provided query
-        response = run_agent_with_query(args.query)
-        print(response) 
\ No newline at end of file
+        response = await run_agent_with_query(agent, query)
+        print(response)
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Speechlab MCP LangChain Integration Example")
+    parser.add_argument("--query", help="User query to process", default=None)
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.query))
@@ -3,5 +3,12 @@ from setuptools import setup
 setup(
     name="speechlab_mcp",
     packages=["speechlab_mcp"],
-    install_requires=["httpx", "python-dotenv", "mcp-api-client"],
+    install_requires=[
+        "httpx[http2]>=0.23.0",
+        "python-dotenv>=0.21.0",
+        "mcp-api-client>=0.1.0",
+        "pydantic>=2.0",
+        "orjson>=3.6.0",
+        "cachetools>=4.0",
+    ],
 ) 
\ No newline at end of file
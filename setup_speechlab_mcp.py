@@ -10,6 +10,7 @@ import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
 import logging
 
@@ -33,8 +34,14 @@ def install_package(package_path="."):
     """Install the Speechlab MCP package."""
     try:
         logger.info("📦 Installing Speechlab MCP...")
+        cmd = [sys.executable, "-m", "pip", "install", "--quiet", "--prefer-binary"]
+        # Building in the current environment skips downloading the build
+        # backend into a fresh isolated environment on every run
+        if importlib.util.find_spec("setuptools") and importlib.util.find_spec("wheel"):
+            cmd.append("--no-build-isolation")
+        cmd += ["-e", package_path]
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-e", package_path],
+            cmd,
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -47,16 +54,20 @@ def install_package(package_path="."):
         logger.error(f"Error output: {e.stderr}")
         return False
 
-def setup_api_key(api_key=None):
-    """Set up the Speechlab API key."""
-    if not api_key:
-        logger.info("🔑 No API key provided. Checking environment...")
-        api_key = os.environ.get("SPEECHLAB_API_KEY")
-        
-        if not api_key:
-            logger.info("❓ No API key found in environment variables.")
-            api_key = input("Enter your Speechlab API key (or leave empty to skip): ")
+def _resolve_api_key(cli_arg=None):
+    """Return the API key from the command line, the environment or a prompt."""
+    if cli_arg:
+        return cli_arg
     
+    logger.info("🔑 No API key provided. Checking environment...")
+    api_key = os.environ.get("SPEECHLAB_API_KEY")
+    if not api_key:
+        logger.info("❓ No API key found in environment variables.")
+        api_key = input("Enter your Speechlab API key (or leave empty to skip): ")
+    return api_key
+
+def setup_api_key(api_key):
+    """Save the resolved Speechlab API key to .env and the current environment."""
     if api_key:
         # Create .env file in current directory
         env_path = Path(".env")
@@ -75,11 +86,8 @@ def setup_api_key(api_key=None):
         logger.warning("⚠️ No API key provided. You'll need to set SPEECHLAB_API_KEY environment variable later.")
         return False
 
-def configure_for_claude(api_key=None):
+def configure_for_claude(api_key):
     """Configure Speechlab MCP for Claude desktop."""
-    if not api_key:
-        api_key = os.environ.get("SPEECHLAB_API_KEY")
-    
     if not api_key:
         logger.error("❌ No API key available for Claude configuration.")
         return False
@@ -126,11 +134,12 @@ def main():
         logger.info("📦 Skipping package installation...")
     
     # Set up API key
-    api_key_setup = setup_api_key(args.api_key)
+    api_key = _resolve_api_key(args.api_key)
+    api_key_setup = setup_api_key(api_key)
     
     # Configure for Claude
     if not args.skip_claude:
-        if not configure_for_claude(args.api_key):
+        if not configure_for_claude(api_key):
             logger.warning("⚠️ Claude configuration failed or skipped.")
     else:
         logger.info("🤖 Skipping Claude desktop configuration...")
@@ -4,22 +4,43 @@ Speechlab MCP package.
 This package provides interfaces to interact with the Speechlab AI dubbing platform.
 It can be used as a Claude desktop plugin or directly imported into other applications.
 """
+import importlib
+
 __version__ = "0.1.0"
 
-# Export main functions for easier importing
-from speechlab_mcp.server import (
-    create_project_and_dub,
-    get_projects,
-    get_project,
-    upload_media,
-    start_dubbing,
-    check_dubbing_status,
-    download_dubbing_result,
-    generate_sharing_link
-)
-
-# Export model classes
-from speechlab_mcp.model import McpProject, McpDubProject, DubMedia
-
-# Export client
-from speechlab_mcp.client import SpeechlabClient 
\ No newline at end of file
+# Exported names, mapped to the module that defines them. They are imported
+# on first access (PEP 562), so importing SpeechlabClient doesn't also load
+# the MCP server and its dependencies.
+_LAZY_EXPORTS = {
+    # Server tools
+    "create_project_and_dub": "speechlab_mcp.server",
+    "get_projects": "speechlab_mcp.server",
+    "get_project": "speechlab_mcp.server",
+    "upload_media": "speechlab_mcp.server",
+    "start_dubbing": "speechlab_mcp.server",
+    "check_dubbing_status": "speechlab_mcp.server",
+    "check_dubbing_statuses": "speechlab_mcp.server",
+    "download_dubbing_result": "speechlab_mcp.server",
+    "generate_sharing_link": "speechlab_mcp.server",
+    # Model classes
+    "McpProject": "speechlab_mcp.model",
+    "McpDubProject": "speechlab_mcp.model",
+    "DubMedia": "speechlab_mcp.model",
+    # Client
+    "SpeechlabClient": "speechlab_mcp.client",
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
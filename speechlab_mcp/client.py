@@ -3,16 +3,29 @@ Speechlab Client
 
 A programmatic client wrapper for the Speechlab API that doesn't require the MCP structure.
 This allows for more direct API usage in regular Python applications.
+
+The client logs to the "speechlab_mcp.client" logger but does not configure
+logging; applications should set up handlers and levels themselves.
 """
 
 import os
+import asyncio
+import functools
+import hashlib
+import itertools
+import random
+import time
+import types
+import inspect
 import httpx
+import orjson
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
 from speechlab_mcp.utils import (
+    LANGUAGE_ALIASES,
     make_error,
     make_output_path,
     make_output_file,
@@ -20,13 +33,64 @@ from speechlab_mcp.utils import (
 )
 from speechlab_mcp import __version__
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Request bodies are encoded with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Maximum number of status requests get_status_many sends at once
+MAX_CONCURRENT_STATUS_REQUESTS = 20
+
+# thirdPartyIDs are the process start time plus a counter, so they stay
+# unique for projects created within the same second
+_ID_PREFIX = time.strftime("%Y%m%d%H%M%S")
+_ID_COUNTER = itertools.count()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_api_key() -> Optional[str]:
+    """Return the SPEECHLAB_API_KEY environment variable, read once."""
+    return os.environ.get("SPEECHLAB_API_KEY")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_base_url() -> str:
+    """Return the SPEECHLAB_API_BASE_URL environment variable, read once."""
+    return os.environ.get("SPEECHLAB_API_BASE_URL", "http://localhost/v1")
+
+
+def invalidate_env_cache() -> None:
+    """Forget cached environment settings, e.g. after a test changes them."""
+    _default_api_key.cache_clear()
+    _default_base_url.cache_clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _payload_skeleton(source_language: str, target_language: str) -> types.MappingProxyType:
+    """Return the constant part of a create-project payload for a language pair."""
+    api_target_language = LANGUAGE_ALIASES.get(target_language, target_language)
+    return types.MappingProxyType({
+        "sourceLanguage": source_language,
+        "targetLanguage": api_target_language,
+        "dubAccent": api_target_language,
+        "voiceMatchingMode": "source",
+        "unitType": "whiteGlove",
+    })
+
+
+@functools.lru_cache(maxsize=8)
+def _expanded_output_dir(output_directory: Optional[str]) -> Path:
+    """Expand a download directory, once per distinct argument."""
+    return Path(os.path.expanduser(output_directory or "~/Desktop"))
+
+
+def _resolved_output_dir(output_directory: Optional[str]) -> Path:
+    """Expand a download directory and make sure it exists."""
+    output_path = _expanded_output_dir(output_directory)
+    # Not cached: the directory may have been removed since the last download
+    output_path.mkdir(parents=True, exist_ok=True)
+    return output_path
+
 
 class SpeechlabClient:
     """
@@ -34,8 +98,18 @@ class SpeechlabClient:
     
     This client provides direct access to Speechlab APIs without requiring
     the MCP framework, making it suitable for use in regular Python applications.
+    All API methods are coroutines; use the client as an async context manager
+    (``async with SpeechlabClient() as client:``) or call ``aclose()`` when done.
+    
+    Instances with the same base URL, API key and timeout share one API
+    connection pool, which is closed when the last of them is closed.
     """
     
+    # Shared API clients keyed by (base_url, API key hash, timeout), and the
+    # number of open SpeechlabClient instances using each
+    _shared_clients: Dict[tuple, httpx.AsyncClient] = {}
+    _shared_refcounts: Dict[tuple, int] = {}
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -50,35 +124,64 @@ class SpeechlabClient:
             base_url: The base URL for the Speechlab API. Defaults to http://localhost/v1
             timeout: Request timeout in seconds
         """
-        self.api_key = api_key or os.environ.get("SPEECHLAB_API_KEY")
+        self.api_key = api_key or _default_api_key()
         if not self.api_key:
             raise ValueError("API key is required. Provide it to the constructor or set SPEECHLAB_API_KEY environment variable.")
             
-        self.base_url = base_url or os.environ.get("SPEECHLAB_API_BASE_URL", "http://localhost/v1")
+        self.base_url = base_url or _default_base_url()
         self.timeout = timeout
         
-        # Create HTTP client
-        self.client = httpx.Client(
-            headers={
-                "User-Agent": f"Speechlab-MCP/{__version__}",
-                "Authorization": f"Bearer {self.api_key}"
-            },
-            timeout=timeout
+        # Reuse the shared HTTP client for this configuration, creating it if
+        # needed. Keep-alive connections are held for longer than the default
+        # polling interval, so status polls reuse open connections.
+        self._pool_key = (self.base_url, hashlib.sha256(self.api_key.encode()).digest(), timeout)
+        self.client = self._shared_clients.get(self._pool_key)
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": f"Speechlab-MCP/{__version__}",
+                    "Authorization": f"Bearer {self.api_key}"
+                },
+                timeout=timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=1000,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=15.0
+                )
+            )
+            self._shared_clients[self._pool_key] = self.client
+        self._shared_refcounts[self._pool_key] = self._shared_refcounts.get(self._pool_key, 0) + 1
+        
+        # Separate pooled client for presigned download URLs, which reject the
+        # API's Authorization header. Reusing it keeps their TLS connections alive.
+        self.download_client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20)
         )
         
-        logger.info(f"[🤖 Speechlab] Client initialized with base URL: {self.base_url}")
+        logger.info("[🤖 Speechlab] Client initialized with base URL: %s", self.base_url)
     
-    def __enter__(self):
+    async def __aenter__(self):
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
         
-    def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+    async def aclose(self):
+        """Close the download client and release the shared API client."""
+        await self.download_client.aclose()
+        
+        if self._pool_key is None:
+            return
+        key, self._pool_key = self._pool_key, None
+        self._shared_refcounts[key] -= 1
+        if self._shared_refcounts[key] == 0:
+            del self._shared_refcounts[key]
+            await self._shared_clients.pop(key).aclose()
     
-    def create_project(
+    async def create_project(
         self,
         name: str,
         source_language: str,
@@ -95,37 +198,32 @@ class SpeechlabClient:
         Returns:
             Dict containing the created project details
         """
-        # Map special language codes if needed
-        api_target_language = target_language
-        if target_language == "es":
-            api_target_language = "es_la"
+        # Map special language codes and fill in the fixed payload fields
+        payload = {
+            **_payload_skeleton(source_language, target_language),
+            "name": name,
+            "thirdPartyID": f"client_{_ID_PREFIX}_{next(_ID_COUNTER)}"
+        }
         
-        logger.info(f"[🤖 Speechlab] Creating project '{name}' with source '{source_language}' and target '{api_target_language}'")
+        logger.info("[🤖 Speechlab] Creating project '%s' with source '%s' and target '%s'", name, source_language, payload['targetLanguage'])
         
         try:
-            response = self.client.post(
+            response = await self.client.post(
                 f"{self.base_url}/projects/createProjectAndDub",
-                json={
-                    "name": name,
-                    "sourceLanguage": source_language,
-                    "targetLanguage": api_target_language,
-                    "dubAccent": api_target_language,
-                    "voiceMatchingMode": "source",
-                    "unitType": "whiteGlove",
-                    "thirdPartyID": f"client_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-                }
+                headers=_JSON_HEADERS,
+                content=orjson.dumps(payload)
             )
             response.raise_for_status()
-            project_data = response.json()
-            logger.info(f"[🤖 Speechlab] ✅ Project created successfully: {project_data}")
+            project_data = orjson.loads(response.content)
+            logger.info("[🤖 Speechlab] ✅ Project created successfully: %s", project_data)
             return project_data
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when creating project: {e}")
-            logger.error(f"[🤖 Speechlab] Status: {e.response.status_code}")
-            logger.error(f"[🤖 Speechlab] Response: {e.response.text}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when creating project: %s", e)
+            logger.error("[🤖 Speechlab] Status: %s", e.response.status_code)
+            logger.error("[🤖 Speechlab] Response: %s", e.response.text)
             raise
     
-    def upload_media(
+    async def upload_media(
         self,
         project_id: str,
         file_path: str
@@ -140,30 +238,35 @@ class SpeechlabClient:
         Returns:
             Dict containing the upload result
         """
-        logger.info(f"[🤖 Speechlab] Uploading media file {file_path} to project {project_id}")
+        logger.info("[🤖 Speechlab] Uploading media file %s to project %s", file_path, project_id)
         
         try:
-            # Validate the file
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
+            # Validate the file with a single stat call
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 raise ValueError(f"File does not exist: {file_path}")
             
-            with open(file_path_obj, "rb") as f:
-                files = {"file": (file_path_obj.name, f, "video/mp4")}
-                response = self.client.post(
+            # Pass the open file handle rather than its bytes: httpx streams it
+            # in 64 KiB chunks and sets Content-Length from the file size, so
+            # memory use stays flat regardless of the media size.
+            logger.debug("[🤖 Speechlab] Streaming %d bytes from %s", file_size, file_path)
+            with open(file_path, "rb") as f:
+                files = {"file": (os.path.basename(file_path), f, "video/mp4")}
+                response = await self.client.post(
                     f"{self.base_url}/projects/{project_id}/upload",
                     files=files
                 )
                 response.raise_for_status()
-                upload_data = response.json()
+                upload_data = orjson.loads(response.content)
                 
-            logger.info(f"[🤖 Speechlab] ✅ File uploaded successfully: {upload_data}")
+            logger.info("[🤖 Speechlab] ✅ File uploaded successfully: %s", upload_data)
             return upload_data
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when uploading media: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when uploading media: %s", e)
             raise
         
-    def start_dubbing(self, project_id: str) -> Dict[str, Any]:
+    async def start_dubbing(self, project_id: str) -> Dict[str, Any]:
         """
         Start the dubbing process for a project.
         
@@ -173,75 +276,119 @@ class SpeechlabClient:
         Returns:
             Dict containing the result of the dubbing request
         """
-        logger.info(f"[🤖 Speechlab] Starting dubbing process for project {project_id}")
+        logger.info("[🤖 Speechlab] Starting dubbing process for project %s", project_id)
         
         try:
-            response = self.client.post(
+            response = await self.client.post(
                 f"{self.base_url}/projects/{project_id}/dub"
             )
             response.raise_for_status()
-            dub_data = response.json()
+            dub_data = orjson.loads(response.content)
             
-            logger.info(f"[🤖 Speechlab] ✅ Dubbing process started: {dub_data}")
+            logger.info("[🤖 Speechlab] ✅ Dubbing process started: %s", dub_data)
             return dub_data
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when starting dubbing: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when starting dubbing: %s", e)
             raise
     
-    def get_project_status(self, project_id: str) -> Dict[str, Any]:
+    async def get_project_status(self, project_id: str, expand: bool = True) -> Dict[str, Any]:
         """
         Get the current status of a project.
         
         Args:
             project_id: ID of the project to check
+            expand: Include nested translations, dubs and medias in the response
             
         Returns:
             Dict containing the project status
         """
-        logger.info(f"[🤖 Speechlab] Getting status for project {project_id}")
+        logger.info("[🤖 Speechlab] Getting status for project %s", project_id)
         
         try:
-            response = self.client.get(
+            response = await self.client.get(
                 f"{self.base_url}/projects/{project_id}",
-                params={"expand": "true"}
+                params={"expand": "true"} if expand else None
             )
             response.raise_for_status()
-            project_data = response.json()
+            project_data = orjson.loads(response.content)
             
-            logger.info(f"[🤖 Speechlab] ✅ Retrieved project status")
+            logger.info("[🤖 Speechlab] ✅ Retrieved project status")
             return project_data
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when getting project status: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when getting project status: %s", e)
+            raise
+
+    async def get_status_many(self, project_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the current status of several projects concurrently.
+        
+        The requests share the client's connection pool, so over HTTP/2 they
+        are multiplexed on a single connection. At most
+        MAX_CONCURRENT_STATUS_REQUESTS are in flight at once. If any request
+        fails, the others are cancelled and the error is raised, so one
+        failure fails the whole call.
+        
+        Args:
+            project_ids: IDs of the projects to check
+        
+        Returns:
+            List of project status dicts, in the same order as project_ids
+        """
+        slots = asyncio.Semaphore(MAX_CONCURRENT_STATUS_REQUESTS)
+        
+        async def get_status(project_id: str) -> Dict[str, Any]:
+            async with slots:
+                return await self.get_project_status(project_id)
+        
+        tasks = [asyncio.ensure_future(get_status(project_id)) for project_id in project_ids]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave the remaining requests running unawaited
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             raise
 
-    def get_projects(self, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+    async def get_projects(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        expand: bool = False
+    ) -> Dict[str, Any]:
         """
         Get a list of projects.
         
         Args:
             limit: Maximum number of projects to retrieve
             offset: Number of projects to skip
+            expand: Include nested translations, dubs and medias for each project,
+                which makes the response much larger
             
         Returns:
             Dict containing the list of projects
         """
-        logger.info(f"[🤖 Speechlab] Getting projects with limit {limit} and offset {offset}")
+        logger.info("[🤖 Speechlab] Getting projects with limit %s and offset %s", limit, offset)
+        
+        params = {"limit": limit, "offset": offset}
+        if expand:
+            params["expand"] = "true"
         
         try:
-            response = self.client.get(
+            response = await self.client.get(
                 f"{self.base_url}/projects",
-                params={"limit": limit, "offset": offset, "expand": "true"}
+                params=params
             )
             response.raise_for_status()
-            projects_data = response.json()
+            projects_data = orjson.loads(response.content)
             
-            logger.info(f"[🤖 Speechlab] ✅ Retrieved {len(projects_data.get('results', []))} projects")
+            logger.info("[🤖 Speechlab] ✅ Retrieved %s projects", len(projects_data.get('results', [])))
             return projects_data
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when getting projects: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when getting projects: %s", e)
             raise
     
-    def download_result(
+    async def download_result(
         self,
         project_id: str,
         output_directory: Optional[str] = None
@@ -256,64 +403,85 @@ class SpeechlabClient:
         Returns:
             Path to the downloaded file
         """
-        logger.info(f"[🤖 Speechlab] Downloading result for project {project_id}")
+        logger.info("[🤖 Speechlab] Downloading result for project %s", project_id)
         
         try:
             # First get project details to find the output media URL
-            project_data = self.get_project_status(project_id)
-            
-            # Navigate the response structure to find the output media
-            download_url = None
-            translations = project_data.get("translations", [])
+            project_data = await self.get_project_status(project_id)
             
-            for translation in translations:
-                dubs = translation.get("dub", [])
-                
-                for dub in dubs:
-                    medias = dub.get("medias", [])
-                    for media in medias:
-                        if media.get("operationType") == "OUTPUT" and media.get("presignedURL"):
-                            download_url = media.get("presignedURL")
-                            break
-                    if download_url:
-                        break
-                if download_url:
-                    break
+            # Find the first output media with a presigned URL
+            download_url = next(
+                (
+                    media["presignedURL"]
+                    for translation in project_data.get("translations", ())
+                    for dub in translation.get("dub", ())
+                    for media in dub.get("medias", ())
+                    if media.get("operationType") == "OUTPUT" and media.get("presignedURL")
+                ),
+                None
+            )
             
             if not download_url:
                 # Try alternative API endpoint if structured search fails
-                url_response = self.client.get(
+                url_response = await self.client.get(
                     f"{self.base_url}/projects/{project_id}/download"
                 )
                 url_response.raise_for_status()
-                url_data = url_response.json()
+                url_data = orjson.loads(url_response.content)
                 
                 if "url" not in url_data:
                     raise ValueError("No download URL available. The dubbing may not be complete.")
                 
                 download_url = url_data["url"]
             
-            # Download the file
-            logger.info(f"[🤖 Speechlab] Downloading from URL: {download_url}")
-            download_response = httpx.get(download_url)
-            download_response.raise_for_status()
-            
-            # Save the file
-            output_path = Path(os.path.expanduser(output_directory or "~/Desktop"))
-            output_path.mkdir(parents=True, exist_ok=True)
+            # Prepare the output file
+            output_path = _resolved_output_dir(output_directory)
             output_file_name = f"dub_project_{project_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
             output_file_path = output_path / output_file_name
             
-            with open(output_file_path, "wb") as f:
-                f.write(download_response.content)
+            # Stream the file to disk in 1 MiB chunks rather than holding it in memory.
+            # The media is already compressed, so ask for it unencoded and write the
+            # raw chunks without passing them through httpx's decoder.
+            logger.info("[🤖 Speechlab] Downloading from URL: %s", download_url)
+            # The body goes to a .part file that is only renamed into place once
+            # it is complete, so a failed download never leaves a file that
+            # looks finished.
+            partial_file_path = output_path / f"{output_file_name}.part"
+            try:
+                async with self.download_client.stream(
+                    "GET", download_url, headers={"Accept-Encoding": "identity"}
+                ) as download_response:
+                    download_response.raise_for_status()
+                    content_length = int(download_response.headers.get("Content-Length", 0))
+                    received = 0
+                    with open(partial_file_path, "wb") as f:
+                        # Reserve the whole file up front where supported, so large
+                        # downloads are laid out contiguously on disk
+                        if content_length and hasattr(os, "posix_fallocate"):
+                            try:
+                                os.posix_fallocate(f.fileno(), 0, content_length)
+                            except OSError:
+                                pass
+                        async for chunk in download_response.aiter_raw(1 << 20):
+                            f.write(chunk)
+                            received += len(chunk)
+                    
+                    if content_length and received != content_length:
+                        raise ValueError(
+                            f"Download incomplete: received {received} of {content_length} bytes"
+                        )
+                os.replace(partial_file_path, output_file_path)
+            except BaseException:
+                partial_file_path.unlink(missing_ok=True)
+                raise
             
-            logger.info(f"[🤖 Speechlab] ✅ Result downloaded to {output_file_path}")
+            logger.info("[🤖 Speechlab] ✅ Result downloaded to %s", output_file_path)
             return str(output_file_path)
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when downloading result: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when downloading result: %s", e)
             raise
         
-    def generate_sharing_link(self, project_id: str) -> str:
+    async def generate_sharing_link(self, project_id: str) -> str:
         """
         Generate a sharing link for a project.
         
@@ -323,65 +491,73 @@ class SpeechlabClient:
         Returns:
             Sharing link URL
         """
-        logger.info(f"[🤖 Speechlab] Generating sharing link for project {project_id}")
+        logger.info("[🤖 Speechlab] Generating sharing link for project %s", project_id)
         
         try:
-            response = self.client.post(
+            response = await self.client.post(
                 f"{self.base_url}/collaborations/generateSharingLink",
-                json={"projectId": project_id}
+                headers=_JSON_HEADERS,
+                content=orjson.dumps({"projectId": project_id})
             )
             response.raise_for_status()
-            link_data = response.json()
+            link_data = orjson.loads(response.content)
             
             if "link" not in link_data:
                 raise ValueError("No sharing link was returned in the response.")
                 
             sharing_link = link_data["link"]
-            logger.info(f"[🤖 Speechlab] ✅ Generated sharing link: {sharing_link}")
+            logger.info("[🤖 Speechlab] ✅ Generated sharing link: %s", sharing_link)
             return sharing_link
         except httpx.HTTPStatusError as e:
-            logger.error(f"[🤖 Speechlab] ❌ HTTP error when generating sharing link: {e}")
+            logger.error("[🤖 Speechlab] ❌ HTTP error when generating sharing link: %s", e)
             raise
     
-    def wait_for_completion(
+    async def wait_for_completion(
         self,
         project_id: str,
         max_attempts: int = 20,
-        delay_seconds: int = 15,
-        callback=None
+        delay_seconds: float = 15,
+        callback=None,
+        max_delay_seconds: float = 60
     ) -> bool:
         """
         Wait for a project to complete by polling status.
         
+        The delay between checks starts around delay_seconds and grows by 1.5x
+        per attempt. Each delay is jittered between half and one and a half
+        times that value, so that many clients polling at once don't hit the
+        API in lockstep, and is never longer than max_delay_seconds.
+        
         Args:
             project_id: ID of the project to check
             max_attempts: Maximum number of status checks
-            delay_seconds: Seconds to wait between checks
+            delay_seconds: Base delay before the second check, before jitter
             callback: Optional callback function to call with status updates
+            max_delay_seconds: Upper bound on the delay between checks
             
         Returns:
             True if project completed successfully, False otherwise
         """
-        import time
-        
-        logger.info(f"[🤖 Speechlab] Waiting for project {project_id} to complete (max {max_attempts} attempts, {delay_seconds}s delay)")
+        logger.info("[🤖 Speechlab] Waiting for project %s to complete (max %s attempts, %ss initial delay)", project_id, max_attempts, delay_seconds)
         
         for attempt in range(max_attempts):
             try:
-                project_data = self.get_project_status(project_id)
+                project_data = await self.get_project_status(project_id)
                 status = project_data.get("job", {}).get("status", "UNKNOWN")
                 
-                logger.info(f"[🤖 Speechlab] Poll #{attempt+1}: Project status: {status}")
+                logger.info("[🤖 Speechlab] Poll #%s: Project status: %s", attempt+1, status)
                 
-                # Call the callback if provided
+                # Call the callback if provided; it may be sync or async
                 if callback:
-                    callback(attempt, project_data)
+                    result = callback(attempt, project_data)
+                    if inspect.isawaitable(result):
+                        await result
                 
                 if status == "COMPLETE":
-                    logger.info(f"[🤖 Speechlab] ✅ Project completed successfully after {attempt+1} attempts!")
+                    logger.info("[🤖 Speechlab] ✅ Project completed successfully after %s attempts!", attempt+1)
                     return True
                 elif status == "FAILED":
-                    logger.error(f"[🤖 Speechlab] ❌ Project failed to process after {attempt+1} attempts!")
+                    logger.error("[🤖 Speechlab] ❌ Project failed to process after %s attempts!", attempt+1)
                     return False
                     
                 # Calculate progress
@@ -389,24 +565,24 @@ class SpeechlabClient:
                 if status == "PROCESSING":
                     progress = "50%"  # Simplified progress estimate
                 
-                logger.info(f"[🤖 Speechlab] ⏳ Poll #{attempt+1}: Project still processing. Progress: {progress}")
-                
-                if attempt < max_attempts - 1:
-                    logger.info(f"[🤖 Speechlab] Waiting {delay_seconds}s before next check...")
-                    time.sleep(delay_seconds)
+                logger.info("[🤖 Speechlab] ⏳ Poll #%s: Project still processing. Progress: %s", attempt+1, progress)
             except Exception as e:
-                logger.error(f"[🤖 Speechlab] ❌ Error checking status (attempt {attempt+1}): {e}")
-                if attempt < max_attempts - 1:
-                    logger.info(f"[🤖 Speechlab] Waiting {delay_seconds}s before next check...")
-                    time.sleep(delay_seconds)
+                logger.error("[🤖 Speechlab] ❌ Error checking status (attempt %s): %s", attempt+1, e)
+            
+            if attempt < max_attempts - 1:
+                delay = min(max_delay_seconds, delay_seconds * 1.5 ** attempt * (0.5 + random.random()))
+                logger.info("[🤖 Speechlab] Waiting %.1fs before next check...", delay)
+                await asyncio.sleep(delay)
         
-        logger.warning(f"[🤖 Speechlab] ⏰ Maximum attempts ({max_attempts}) reached without completion.")
+        logger.warning("[🤖 Speechlab] ⏰ Maximum attempts (%s) reached without completion.", max_attempts)
         return False
     
 # Example usage
 if __name__ == "__main__":
-    client = SpeechlabClient()
-    # Create a new project
-    project = client.create_project("API Client Test", "en", "es")
-    print(f"Created project: {project}")
-    client.close() 
\ No newline at end of file
+    async def _example():
+        async with SpeechlabClient() as client:
+            # Create a new project
+            project = await client.create_project("API Client Test", "en", "es")
+            print(f"Created project: {project}")
+    
+    asyncio.run(_example()) 
\ No newline at end of file
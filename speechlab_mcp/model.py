@@ -1,6 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Optional, List, Any
 
+# Shared by all models: instances are immutable and unknown API fields are dropped.
+# Pydantic keeps field values in the instance __dict__, so the models don't
+# declare __slots__; slots named after fields would be shadowed by pydantic.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
 
 class McpProject(BaseModel):
     """
@@ -14,6 +19,8 @@ class McpProject(BaseModel):
         updated_at: ISO-8601 timestamp of last update time
         metadata: Additional project metadata
     """
+    model_config = _MODEL_CONFIG
+
     id: str
     name: str
     status: str
@@ -37,6 +44,8 @@ class McpDubProject(BaseModel):
         source_file: Path to the original uploaded source file (if available)
         metadata: Additional project metadata
     """
+    model_config = _MODEL_CONFIG
+
     id: str
     name: str
     status: str
@@ -61,6 +70,8 @@ class DubMedia(BaseModel):
         operation_type: Type of operation (e.g., "INPUT", "OUTPUT")
         presigned_url: URL for direct media access (if available)
     """
+    model_config = _MODEL_CONFIG
+
     id: str
     uri: str
     category: str
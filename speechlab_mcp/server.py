@@ -5,18 +5,27 @@ This server provides access to Speechlab API endpoints for dubbing and project m
 Each tool that makes an API call is marked for clarity.
 """
 
+import asyncio
+import functools
+import inspect
 import httpx
+import cachetools
 import os
-import json
+import random
+import weakref
+import orjson
 import logging
+import time
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
-from speechlab_mcp.model import McpProject, McpDubProject
+from speechlab_mcp.model import McpDubProject
 from speechlab_mcp.utils import (
+    LANGUAGE_ALIASES,
     make_error,
     make_output_path,
     make_output_file,
@@ -39,15 +48,97 @@ api_base_url = os.getenv("SPEECHLAB_API_BASE_URL", "http://localhost/v1")
 if not api_key:
     raise ValueError("SPEECHLAB_API_KEY environment variable is required")
 
-# Add custom client to set User-Agent header
-custom_client = httpx.Client(
+# Request bodies are encoded with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Template for each project in the get_projects listing
+_PROJECT_SUMMARY = "ID: {}\nName: {}\nStatus: {}\nCreated: {}".format
+
+# Project settings that are the same for every createProjectAndDub request
+_CREATE_PROJECT_FIELDS = {
+    "voiceMatchingMode": "source",  # Added from TypeScript example
+    "unitType": "whiteGlove",       # Added from TypeScript example
+}
+
+async def _log_http_version(response: httpx.Response) -> None:
+    """Log the negotiated protocol, to confirm requests are multiplexed over HTTP/2."""
+    logger.debug("[🤖 Speechlab] %s %s over %s", response.request.method, response.url.path, response.http_version)
+
+# Connection pool for the API client. Over HTTP/2, concurrent requests share
+# one connection as separate streams, so idle connections are kept for a
+# minute rather than reopened.
+API_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=60.0)
+
+def _api_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Create the transport for the API client.
+    
+    Pool settings go on the transport: a client given its own transport
+    ignores client-level limits and http2.
+    """
+    return httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=API_POOL_LIMITS,
+        retries=3  # Retry failed connection attempts
+    )
+
+# Add custom client to set User-Agent header. All tools share this client, so
+# its keep-alive pool lets repeated tool calls reuse open connections, and
+# since it is async, concurrent tool calls don't block the server's event loop.
+custom_client = httpx.AsyncClient(
     headers={
         "User-Agent": f"Speechlab-MCP/{__version__}",
         "Authorization": f"Bearer {api_key}"
     },
-    timeout=30.0  # 30 second timeout, matching TypeScript example
+    timeout=httpx.Timeout(30.0, connect=10.0),  # 30 second timeout, matching TypeScript example
+    transport=_api_transport(),
+    event_hooks={"response": [_log_http_version]}
+)
+
+# Separate pooled client for presigned download URLs, which reject the API's
+# Authorization header. Reusing it keeps connections to the storage host alive
+# across downloads; there is no read timeout since large videos take a while.
+download_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(None, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=8),
+    follow_redirects=True
 )
 
+# Project details fetched in the last few seconds, keyed by project ID, so
+# agents polling a project in quick succession share one upstream request.
+# Entries are dropped by _invalidate_project when a tool changes the project.
+_project_cache = cachetools.TTLCache(maxsize=512, ttl=3.0)
+
+# Project fetches currently in flight, keyed by project ID, so concurrent
+# callers asking for the same project await one upstream request
+_inflight_projects: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Bumped each time a tool changes a project, so a fetch that was already in
+# flight doesn't cache the project as it was before the change
+_project_generations: Dict[str, int] = {}
+
+# Maximum number of API requests in flight at once, across all tool calls
+MAX_CONCURRENT_REQUESTS = 20
+
+# Attempts made for a request that is rate limited or hits an unavailable upstream
+MAX_REQUEST_ATTEMPTS = 4
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Methods that are safe to resend after a gateway error. Other requests (such
+# as creating a project or starting a dub) may already have been acted on, so
+# they are only retried when the API says it didn't process them.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# Longest Retry-After the server will honour before giving up on the wait
+MAX_RETRY_DELAY = 30.0
+
+# Request limiters, one per event loop since a semaphore can't be shared
+# between loops on older Pythons
+_request_limiters = weakref.WeakKeyDictionary()
+
+# Chunk size for streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 mcp = FastMCP("Speechlab")
 
 def handle_api_error(error: Exception, context: str) -> None:
@@ -59,14 +150,227 @@ def handle_api_error(error: Exception, context: str) -> None:
         context: Description of the operation being performed
     """
     if isinstance(error, httpx.HTTPStatusError):
-        logger.error(f"[🤖 Speechlab] ❌ API Error during {context}: {error}")
-        logger.error(f"[🤖 Speechlab] Status: {error.response.status_code}")
-        logger.error(f"[🤖 Speechlab] Data: {error.response.text}")
-        logger.error(f"[🤖 Speechlab] Headers: {dict(error.response.headers)}")
+        logger.error("[🤖 Speechlab] ❌ API Error during %s: %s", context, error)
+        logger.error("[🤖 Speechlab] Status: %s", error.response.status_code)
+        logger.error("[🤖 Speechlab] Data: %s", error.response.text)
+        logger.error("[🤖 Speechlab] Headers: %s", dict(error.response.headers))
     elif isinstance(error, httpx.RequestError):
-        logger.error(f"[🤖 Speechlab] ❌ Request error during {context}: {error}")
+        logger.error("[🤖 Speechlab] ❌ Request error during %s: %s", context, error)
     else:
-        logger.error(f"[🤖 Speechlab] ❌ Non-HTTP error during {context}: {error}")
+        logger.error("[🤖 Speechlab] ❌ Non-HTTP error during %s: %s", context, error)
+
+def api_tool(context: str, error_message: str):
+    """
+    Decorator giving a tool the standard error handling.
+    
+    HTTP errors are logged with handle_api_error and other errors with their
+    message; both are then re-raised through make_error.
+    
+    Args:
+        context: Description of the operation for API error logs, formatted
+            with the tool's arguments (e.g. "getting project {project_id}")
+        error_message: Prefix for the error reported on non-HTTP failures
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                arguments = signature.bind(*args, **kwargs).arguments
+                handle_api_error(e, context.format(**arguments))
+                make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
+            except Exception as e:
+                logger.error("[🤖 Speechlab] ❌ %s: %s", error_message, e)
+                make_error(f"{error_message}: {str(e)}")
+        
+        return wrapper
+    return decorator
+
+def _request_limiter() -> asyncio.Semaphore:
+    """Return the request limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limiter = _request_limiters.get(loop)
+    if limiter is None:
+        limiter = _request_limiters[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return limiter
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a request.
+    
+    Args:
+        response: The rate limited or unavailable response
+        attempt: Zero-based number of the attempt that failed
+        
+    Returns:
+        The server's Retry-After in seconds if it sent one, otherwise an
+        exponential backoff with a little jitter
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # An HTTP date rather than seconds; fall back to backoff
+    return 0.25 * 2 ** attempt + random.random() * 0.1
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    """
+    Decide whether a failed request can safely be sent again.
+    
+    Args:
+        method: HTTP method of the request
+        response: The response it got
+        
+    Returns:
+        True for a 429, for gateway errors on idempotent requests, and for a
+        503 with a Retry-After on any request
+    """
+    status_code = response.status_code
+    if status_code not in RETRY_STATUS_CODES:
+        return False
+    if status_code == 429 or method.upper() in IDEMPOTENT_METHODS:
+        return True
+    return status_code == 503 and "Retry-After" in response.headers
+
+async def _api_request(method: str, path: str, **kwargs) -> httpx.Response:
+    """
+    Send a request to the Speechlab API through the shared client.
+    
+    Requests are limited to MAX_CONCURRENT_REQUESTS in flight, and rate
+    limited or unavailable responses are retried with backoff, so bursts of
+    tool calls don't surface transient 429s and 5xxs as errors. See
+    _should_retry for which responses are retried. A request gives up its
+    slot while it waits to retry.
+    
+    Args:
+        method: HTTP method
+        path: API path, relative to the API base URL
+        **kwargs: Passed through to httpx.AsyncClient.request
+        
+    Returns:
+        The response of the last attempt, whatever its status
+    """
+    for attempt in range(MAX_REQUEST_ATTEMPTS):
+        async with _request_limiter():
+            response = await custom_client.request(method, f"{api_base_url}{path}", **kwargs)
+        if attempt == MAX_REQUEST_ATTEMPTS - 1 or not _should_retry(method, response):
+            return response
+        
+        delay = _retry_delay(response, attempt)
+        logger.warning(
+            "[🤖 Speechlab] %s %s returned %s, retrying in %.2fs",
+            method, path, response.status_code, delay
+        )
+        await response.aclose()
+        await asyncio.sleep(delay)
+
+async def _fetch_project(project_id: str) -> Dict[str, Any]:
+    """
+    Get a project's expanded details, served from a short-lived cache.
+    
+    Concurrent calls for a project that isn't cached share a single request.
+    
+    Args:
+        project_id: ID of the project to fetch
+        
+    Returns:
+        The parsed project response
+    """
+    project_data = _project_cache.get(project_id)
+    if project_data is not None:
+        return project_data
+    
+    fetch = _inflight_projects.get(project_id)
+    if fetch is None:
+        fetch = _inflight_projects[project_id] = asyncio.ensure_future(_get_project(project_id))
+        fetch.add_done_callback(
+            lambda done: _inflight_projects.pop(project_id, None)
+            if _inflight_projects.get(project_id) is done else None
+        )
+    # Shielded so a cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(fetch)
+
+async def _get_project(project_id: str) -> Dict[str, Any]:
+    """Fetch a project's expanded details from the API and cache them."""
+    generation = _project_generations.get(project_id, 0)
+    response = await _api_request(
+        "GET", f"/projects/{project_id}",
+        params={"expand": "true"}  # Added from TypeScript example
+    )
+    response.raise_for_status()
+    project_data = orjson.loads(response.content)
+    # Only cache the project if no tool changed it while it was being fetched
+    if _project_generations.get(project_id, 0) == generation:
+        _project_cache[project_id] = project_data
+    return project_data
+
+def _invalidate_project(project_id: str) -> None:
+    """
+    Forget what is known about a project after a tool changes it.
+    
+    Drops the cached details and any fetch in flight, so later callers see
+    the change, and stops fetches started before it from caching the old data.
+    
+    Args:
+        project_id: ID of the project that was changed
+    """
+    _project_cache.pop(project_id, None)
+    _inflight_projects.pop(project_id, None)
+    _project_generations[project_id] = _project_generations.get(project_id, 0) + 1
+
+def _summarize_project(project_data: Dict[str, Any]) -> str:
+    """Format one project of a get_projects response for the listing."""
+    job = project_data.get("job", {})
+    return _PROJECT_SUMMARY(
+        project_data["id"],
+        job.get("name", "Unnamed Project"),
+        job.get("status", "unknown"),
+        project_data.get("createdAt", "unknown")
+    )
+
+def _iter_dubs(project_data: Dict[str, Any]):
+    """Yield every dub of every translation in an expanded project."""
+    for translation in project_data.get("translations") or ():
+        yield from translation.get("dub") or ()
+
+def _output_url(dub: Dict[str, Any]) -> Optional[str]:
+    """Return the presigned URL of a dub's output media, if it has one."""
+    return next(
+        (
+            media["presignedURL"]
+            for media in dub.get("medias") or ()
+            if media.get("operationType") == "OUTPUT" and media.get("presignedURL")
+        ),
+        None
+    )
+
+async def _upload_file(project_id: str, file_path: Path) -> Dict[str, Any]:
+    """
+    Upload a media file to a project, streaming it from disk.
+    
+    The open file handle is passed rather than its bytes: httpx reads it in
+    64 KiB chunks as the request is sent and takes Content-Length from the
+    file size, so memory use stays flat regardless of the media size.
+    
+    Args:
+        project_id: ID of the project to upload to
+        file_path: Validated path to the media file
+        
+    Returns:
+        The parsed upload response
+    """
+    with open(file_path, "rb") as f:
+        files = {"file": (file_path.name, f, "video/mp4")}
+        response = await _api_request(
+            "POST", f"/projects/{project_id}/upload",
+            files=files
+        )
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 @mcp.tool(
     description="""Create a new project in Speechlab and set it up for dubbing.
@@ -83,7 +387,8 @@ def handle_api_error(error: Exception, context: str) -> None:
         TextContent containing the details of the created project
     """
 )
-def create_project_and_dub(
+@api_tool("project creation for '{name}'", "Error creating project")
+async def create_project_and_dub(
     name: str,
     source_language: str,
     target_language: str,
@@ -91,71 +396,55 @@ def create_project_and_dub(
     output_directory: Optional[str] = None,
 ) -> TextContent:
     # Map special language codes like 'es' to their API-specific variants
-    api_target_language = target_language
-    if target_language == "es":
-        api_target_language = "es_la"
-        logger.debug(f"[🤖 Speechlab] Mapped target language code '{target_language}' to API target language: '{api_target_language}'")
+    api_target_language = LANGUAGE_ALIASES.get(target_language, target_language)
+    if api_target_language != target_language:
+        logger.debug("[🤖 Speechlab] Mapped target language code '%s' to API target language: '%s'", target_language, api_target_language)
     
-    logger.info(f"[🤖 Speechlab] Creating project '{name}' with source language '{source_language}' and target '{api_target_language}'")
+    logger.info("[🤖 Speechlab] Creating project '%s' with source language '%s' and target '%s'", name, source_language, api_target_language)
     
     # First, create the project
-    try:
-        create_response = custom_client.post(
-            f"{api_base_url}/projects/createProjectAndDub",
-            json={
-                "name": name,
-                "sourceLanguage": source_language,
-                "targetLanguage": api_target_language,
-                "dubAccent": api_target_language,  # Added from TypeScript example
-                "voiceMatchingMode": "source",     # Added from TypeScript example
-                "unitType": "whiteGlove",          # Added from TypeScript example
-                "thirdPartyID": f"mcp_{datetime.now().strftime('%Y%m%d%H%M%S')}"  # Unique ID
-            }
-        )
-        create_response.raise_for_status()
-        project_data = create_response.json()
-        
-        logger.info(f"[🤖 Speechlab] ✅ Project created successfully: {project_data}")
-        
-        # If source file is provided, upload it
-        if source_file:
-            file_path = handle_input_file(source_file)
-            
-            logger.info(f"[🤖 Speechlab] Uploading file {file_path} to project {project_data['id']}")
-            with open(file_path, "rb") as f:
-                files = {"file": (file_path.name, f, "video/mp4")}
-                upload_response = custom_client.post(
-                    f"{api_base_url}/projects/{project_data['id']}/upload",
-                    files=files
-                )
-                upload_response.raise_for_status()
-                upload_data = upload_response.json()
-                logger.info(f"[🤖 Speechlab] ✅ File uploaded successfully: {upload_data}")
-        
-        # Format the project data for return
-        project = McpDubProject(
-            id=project_data["id"],
-            name=project_data["name"],
-            status=project_data.get("status", "created"),
-            created_at=project_data.get("createdAt", datetime.now().isoformat()),
-            updated_at=project_data.get("updatedAt", datetime.now().isoformat()),
-            source_language=project_data["sourceLanguage"],
-            target_language=project_data["targetLanguage"],
-            source_file=source_file if source_file else None,
-            metadata=project_data.get("metadata", {})
-        )
-        
-        return TextContent(
-            type="text",
-            text=f"Project created successfully:\nID: {project.id}\nName: {project.name}\nSource Language: {project.source_language}\nTarget Language: {project.target_language}\nStatus: {project.status}"
-        )
+    create_response = await _api_request(
+        "POST", "/projects/createProjectAndDub",
+        headers=_JSON_HEADERS,
+        content=orjson.dumps({
+            **_CREATE_PROJECT_FIELDS,
+            "name": name,
+            "sourceLanguage": source_language,
+            "targetLanguage": api_target_language,
+            "dubAccent": api_target_language,  # Added from TypeScript example
+            "thirdPartyID": f"mcp_{time.strftime('%Y%m%d%H%M%S')}"  # Unique ID
+        })
+    )
+    create_response.raise_for_status()
+    project_data = orjson.loads(create_response.content)
+    
+    logger.info("[🤖 Speechlab] ✅ Project created successfully: %s", project_data)
+    
+    # If source file is provided, upload it
+    if source_file:
+        file_path = handle_input_file(source_file)
         
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"project creation for '{name}'")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error creating project: {e}")
-        make_error(f"Error creating project: {str(e)}")
+        logger.info("[🤖 Speechlab] Uploading file %s to project %s", file_path, project_data['id'])
+        upload_data = await _upload_file(project_data["id"], file_path)
+        logger.info("[🤖 Speechlab] ✅ File uploaded successfully: %s", upload_data)
+    
+    # Format the project data for return
+    project = McpDubProject(
+        id=project_data["id"],
+        name=project_data["name"],
+        status=project_data.get("status", "created"),
+        created_at=project_data.get("createdAt", datetime.now().isoformat()),
+        updated_at=project_data.get("updatedAt", datetime.now().isoformat()),
+        source_language=project_data["sourceLanguage"],
+        target_language=project_data["targetLanguage"],
+        source_file=source_file if source_file else None,
+        metadata=project_data.get("metadata", {})
+    )
+    
+    return TextContent(
+        type="text",
+        text=f"Project created successfully:\nID: {project.id}\nName: {project.name}\nSource Language: {project.source_language}\nTarget Language: {project.target_language}\nStatus: {project.status}"
+    )
 
 
 @mcp.tool(
@@ -169,54 +458,34 @@ def create_project_and_dub(
         TextContent containing the list of projects
     """
 )
-def get_projects(
+@api_tool("listing projects", "Error getting projects")
+async def get_projects(
     limit: int = 10,
     offset: int = 0
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Getting projects with limit {limit} and offset {offset}")
+    logger.info("[🤖 Speechlab] Getting projects with limit %s and offset %s", limit, offset)
     
-    try:
-        response = custom_client.get(
-            f"{api_base_url}/projects",
-            params={"limit": limit, "offset": offset, "expand": "true"}  # Added expand parameter from TypeScript example
-        )
-        response.raise_for_status()
-        projects_data = response.json()
-        
-        logger.info(f"[🤖 Speechlab] ✅ Retrieved {len(projects_data.get('results', []))} projects")
-        
-        # Handle response format based on TypeScript example
-        results = projects_data.get('results', [])
-        if not results:
-            return TextContent(type="text", text="No projects found.")
-        
-        # Format the projects data for return
-        projects_list = []
-        for project_data in results:
-            project = McpProject(
-                id=project_data["id"],
-                name=project_data.get("job", {}).get("name", "Unnamed Project"),
-                status=project_data.get("job", {}).get("status", "unknown"),
-                created_at=project_data.get("createdAt", "unknown"),
-                updated_at=project_data.get("updatedAt", "unknown"),
-                metadata=project_data.get("metadata", {})
-            )
-            projects_list.append(
-                f"ID: {project.id}\nName: {project.name}\nStatus: {project.status}\nCreated: {project.created_at}"
-            )
-        
-        formatted_projects = "\n\n".join(projects_list)
-        return TextContent(
-            type="text",
-            text=f"Retrieved {len(projects_list)} projects:\n\n{formatted_projects}"
-        )
-        
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, "listing projects")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error getting projects: {e}")
-        make_error(f"Error getting projects: {str(e)}")
+    response = await _api_request(
+        "GET", "/projects",
+        params={"limit": limit, "offset": offset, "expand": "true"}  # Added expand parameter from TypeScript example
+    )
+    response.raise_for_status()
+    projects_data = orjson.loads(response.content)
+    
+    logger.info("[🤖 Speechlab] ✅ Retrieved %s projects", len(projects_data.get('results', [])))
+    
+    # Handle response format based on TypeScript example
+    results = projects_data.get('results', [])
+    if not results:
+        return TextContent(type="text", text="No projects found.")
+    
+    # Format the projects data for return, straight from the response since
+    # the listing only shows a few fields of each project
+    formatted_projects = "\n\n".join(map(_summarize_project, results))
+    return TextContent(
+        type="text",
+        text=f"Retrieved {len(results)} projects:\n\n{formatted_projects}"
+    )
 
 
 @mcp.tool(
@@ -229,65 +498,53 @@ def get_projects(
         TextContent containing the project details
     """
 )
-def get_project(
+@api_tool("getting project {project_id}", "Error getting project")
+async def get_project(
     project_id: str
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Getting project with ID {project_id}")
+    logger.info("[🤖 Speechlab] Getting project with ID %s", project_id)
     
-    try:
-        response = custom_client.get(
-            f"{api_base_url}/projects/{project_id}",
-            params={"expand": "true"}  # Added from TypeScript example
-        )
-        response.raise_for_status()
-        project_data = response.json()
-        
-        logger.info(f"[🤖 Speechlab] ✅ Retrieved project: {project_data.get('id', 'unknown ID')}")
-        
-        # Format the project data for return, adjust based on the TypeScript example structure
-        job_data = project_data.get("job", {})
-        project = McpDubProject(
-            id=project_data["id"],
-            name=job_data.get("name", "Unnamed Project"),
-            status=job_data.get("status", "unknown"),
-            created_at=project_data.get("createdAt", "unknown"),
-            updated_at=project_data.get("updatedAt", "unknown"),
-            source_language=job_data.get("sourceLanguage", "unknown"),
-            target_language=job_data.get("targetLanguage", "unknown"),
-            source_file=None,  # Source file info not in response
-            metadata=project_data.get("metadata", {})
-        )
-        
-        # Check for additional information from translations
-        translations = project_data.get("translations", [])
-        translation_info = ""
-        if translations:
-            first_translation = translations[0]
-            translation_info = f"\nTranslation Language: {first_translation.get('language', 'unknown')}"
+    project_data = await _fetch_project(project_id)
+    
+    logger.info("[🤖 Speechlab] ✅ Retrieved project: %s", project_data.get('id', 'unknown ID'))
+    
+    # Format the project data for return, adjust based on the TypeScript example structure
+    job_data = project_data.get("job", {})
+    project = McpDubProject(
+        id=project_data["id"],
+        name=job_data.get("name", "Unnamed Project"),
+        status=job_data.get("status", "unknown"),
+        created_at=project_data.get("createdAt", "unknown"),
+        updated_at=project_data.get("updatedAt", "unknown"),
+        source_language=job_data.get("sourceLanguage", "unknown"),
+        target_language=job_data.get("targetLanguage", "unknown"),
+        source_file=None,  # Source file info not in response
+        metadata=project_data.get("metadata", {})
+    )
+    
+    # Check for additional information from translations
+    translations = project_data.get("translations", [])
+    translation_info = ""
+    if translations:
+        first_translation = translations[0]
+        translation_info = f"\nTranslation Language: {first_translation.get('language', 'unknown')}"
+        
+        # Check for dub information
+        dubs = first_translation.get("dub", [])
+        if dubs:
+            first_dub = dubs[0]
+            translation_info += f"\nDub Status: {first_dub.get('mergeStatus', 'unknown')}"
             
-            # Check for dub information
-            dubs = first_translation.get("dub", [])
-            if dubs:
-                first_dub = dubs[0]
-                translation_info += f"\nDub Status: {first_dub.get('mergeStatus', 'unknown')}"
-                
-                # Check for media files
-                medias = first_dub.get("medias", [])
-                if medias:
-                    media_count = len(medias)
-                    translation_info += f"\nMedia Files: {media_count}"
-        
-        return TextContent(
-            type="text",
-            text=f"Project Details:\nID: {project.id}\nName: {project.name}\nStatus: {project.status}\nSource Language: {project.source_language}\nTarget Language: {project.target_language}\nCreated: {project.created_at}\nUpdated: {project.updated_at}{translation_info}"
-        )
-        
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"getting project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error getting project: {e}")
-        make_error(f"Error getting project: {str(e)}")
+            # Check for media files
+            medias = first_dub.get("medias", [])
+            if medias:
+                media_count = len(medias)
+                translation_info += f"\nMedia Files: {media_count}"
+    
+    return TextContent(
+        type="text",
+        text=f"Project Details:\nID: {project.id}\nName: {project.name}\nStatus: {project.status}\nSource Language: {project.source_language}\nTarget Language: {project.target_language}\nCreated: {project.created_at}\nUpdated: {project.updated_at}{translation_info}"
+    )
 
 
 @mcp.tool(
@@ -301,37 +558,24 @@ def get_project(
         TextContent containing the upload result
     """
 )
-def upload_media(
+@api_tool("uploading media to project {project_id}", "Error uploading media")
+async def upload_media(
     project_id: str,
     file_path: str
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Uploading media file {file_path} to project {project_id}")
+    logger.info("[🤖 Speechlab] Uploading media file %s to project %s", file_path, project_id)
     
-    try:
-        file_path_obj = handle_input_file(file_path)
-        
-        with open(file_path_obj, "rb") as f:
-            files = {"file": (file_path_obj.name, f, "video/mp4")}
-            response = custom_client.post(
-                f"{api_base_url}/projects/{project_id}/upload",
-                files=files
-            )
-            response.raise_for_status()
-            upload_data = response.json()
-            
-        logger.info(f"[🤖 Speechlab] ✅ File uploaded successfully: {upload_data}")
-        
-        return TextContent(
-            type="text",
-            text=f"File uploaded successfully to project {project_id}.\nFile: {file_path_obj.name}"
-        )
-        
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"uploading media to project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error uploading media: {e}")
-        make_error(f"Error uploading media: {str(e)}")
+    file_path_obj = handle_input_file(file_path)
+    
+    upload_data = await _upload_file(project_id, file_path_obj)
+    _invalidate_project(project_id)
+    
+    logger.info("[🤖 Speechlab] ✅ File uploaded successfully: %s", upload_data)
+    
+    return TextContent(
+        type="text",
+        text=f"File uploaded successfully to project {project_id}.\nFile: {file_path_obj.name}"
+    )
 
 
 @mcp.tool(
@@ -344,31 +588,99 @@ def upload_media(
         TextContent containing the result of the dubbing request
     """
 )
-def start_dubbing(
+@api_tool("starting dubbing for project {project_id}", "Error starting dubbing")
+async def start_dubbing(
     project_id: str
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Starting dubbing process for project {project_id}")
+    logger.info("[🤖 Speechlab] Starting dubbing process for project %s", project_id)
     
-    try:
-        response = custom_client.post(
-            f"{api_base_url}/projects/{project_id}/dub"
-        )
-        response.raise_for_status()
-        dub_data = response.json()
-        
-        logger.info(f"[🤖 Speechlab] ✅ Dubbing process started: {dub_data}")
+    response = await _api_request(
+        "POST", f"/projects/{project_id}/dub"
+    )
+    response.raise_for_status()
+    dub_data = orjson.loads(response.content)
+    _invalidate_project(project_id)
+    
+    logger.info("[🤖 Speechlab] ✅ Dubbing process started: %s", dub_data)
+    
+    return TextContent(
+        type="text",
+        text=f"Dubbing process started for project {project_id}.\nStatus: {dub_data.get('status', 'processing')}\nETA: {dub_data.get('eta', 'unknown')}"
+    )
+
+
+async def get_dubbing_status(project_id: str) -> Dict[str, Any]:
+    """
+    Get the dubbing status of a project as structured data.
+    
+    This is the non-MCP counterpart of check_dubbing_status, for callers such
+    as polling loops that need to act on the status rather than display it.
+    
+    Args:
+        project_id: ID of the project to check
         
-        return TextContent(
-            type="text",
-            text=f"Dubbing process started for project {project_id}.\nStatus: {dub_data.get('status', 'processing')}\nETA: {dub_data.get('eta', 'unknown')}"
-        )
+    Returns:
+        Dict with the job "status", a "progress" estimate, the "dub_status"
+        merge status, "media_count" and whether "output_available" is set
+    """
+    # Fetch the full project details to get comprehensive status info
+    project_data = await _fetch_project(project_id)
+    
+    logger.debug("[🤖 Speechlab] Retrieved project for status check: %s", project_data)
+    
+    # Get the job status from the structure
+    job_data = project_data.get("job", {})
+    status = job_data.get("status", "UNKNOWN")
+    
+    # Calculate a progress estimate based on status
+    progress = "0%"
+    if status == "PROCESSING":
+        progress = "50%"
+    elif status == "COMPLETE":
+        progress = "100%"
+    
+    # Report on the first dub, if the project has one yet
+    first_dub = next(_iter_dubs(project_data), None)
+    if first_dub is None:
+        dub_status, media_count, output_available = "Not started", 0, False
+    else:
+        dub_status = first_dub.get("mergeStatus", "Unknown")
+        media_count = len(first_dub.get("medias") or ())
+        output_available = _output_url(first_dub) is not None
+    
+    return {
+        "status": status,
+        "progress": progress,
+        "dub_status": dub_status,
+        "media_count": media_count,
+        "output_available": output_available,
+    }
+
+
+def format_dubbing_status(project_id: str, status: Dict[str, Any]) -> str:
+    """
+    Format a get_dubbing_status result for display.
+    
+    Args:
+        project_id: ID of the project the status belongs to
+        status: Status dict returned by get_dubbing_status
         
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"starting dubbing for project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error starting dubbing: {e}")
-        make_error(f"Error starting dubbing: {str(e)}")
+    Returns:
+        Multi-line status text
+    """
+    media_info = ""
+    if status["media_count"]:
+        media_info = f"\nMedia Files: {status['media_count']} files available"
+        if status["output_available"]:
+            media_info += f"\nOutput media available for download"
+    
+    # Format the status with all the details
+    return (
+        f"Dubbing Status for Project {project_id}:\n"
+        f"Status: {status['status']}\n"
+        f"Progress: {status['progress']}\n"
+        f"Dub Process: {status['dub_status']}{media_info}"
+    )
 
 
 @mcp.tool(
@@ -381,73 +693,52 @@ def start_dubbing(
         TextContent containing the status of the dubbing job
     """
 )
-def check_dubbing_status(
+@api_tool("checking status for project {project_id}", "Error checking dubbing status")
+async def check_dubbing_status(
     project_id: str
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Checking dubbing status for project {project_id}")
+    logger.info("[🤖 Speechlab] Checking dubbing status for project %s", project_id)
     
-    try:
-        # Fetch the full project details to get comprehensive status info
-        response = custom_client.get(
-            f"{api_base_url}/projects/{project_id}",
-            params={"expand": "true"}
-        )
-        response.raise_for_status()
-        project_data = response.json()
-        
-        logger.info(f"[🤖 Speechlab] Retrieved project for status check: {project_data}")
-        
-        # Get the job status from the structure
-        job_data = project_data.get("job", {})
-        status = job_data.get("status", "UNKNOWN")
-        
-        # Calculate a progress estimate based on status
-        progress = "0%"
-        if status == "PROCESSING":
-            progress = "50%"
-        elif status == "COMPLETE":
-            progress = "100%"
-        
-        # Look for translation and dub details
-        translations = project_data.get("translations", [])
-        dub_status = "Not started"
-        media_info = ""
-        
-        if translations:
-            first_translation = translations[0]
-            dubs = first_translation.get("dub", [])
-            
-            if dubs:
-                first_dub = dubs[0]
-                dub_status = first_dub.get("mergeStatus", "Unknown")
-                
-                # Check for media files
-                medias = first_dub.get("medias", [])
-                if medias:
-                    media_count = len(medias)
-                    media_info = f"\nMedia Files: {media_count} files available"
-                    
-                    # Find output media if available
-                    output_media = next((m for m in medias if m.get("operationType") == "OUTPUT"), None)
-                    if output_media and output_media.get("presignedURL"):
-                        media_info += f"\nOutput media available for download"
-        
-        # Format the status with all the details
-        status_text = (
-            f"Dubbing Status for Project {project_id}:\n"
-            f"Status: {status}\n"
-            f"Progress: {progress}\n"
-            f"Dub Process: {dub_status}{media_info}"
-        )
-        
-        return TextContent(type="text", text=status_text)
+    status = await get_dubbing_status(project_id)
+    return TextContent(type="text", text=format_dubbing_status(project_id, status))
+
+
+@mcp.tool(
+    description="""Check the status of dubbing jobs for several projects at once.
+    
+    Args:
+        project_ids: IDs of the projects to check
         
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"checking status for project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error checking dubbing status: {e}")
-        make_error(f"Error checking dubbing status: {str(e)}")
+    Returns:
+        TextContent containing the status of each dubbing job
+    """
+)
+async def check_dubbing_statuses(
+    project_ids: List[str]
+) -> TextContent:
+    logger.info("[🤖 Speechlab] Checking dubbing status for %s projects", len(project_ids))
+    
+    # Check the projects concurrently; _api_request caps how many of the
+    # requests are in flight at once
+    results = await asyncio.gather(
+        *(get_dubbing_status(project_id) for project_id in project_ids),
+        return_exceptions=True
+    )
+    
+    # Report failures per project rather than failing the whole batch
+    sections = []
+    for project_id, result in zip(project_ids, results):
+        if isinstance(result, Exception):
+            handle_api_error(result, f"checking status for project {project_id}")
+            if isinstance(result, httpx.HTTPStatusError):
+                error = f"HTTP error occurred: {result.response.status_code}"
+            else:
+                error = str(result)
+            sections.append(f"Dubbing Status for Project {project_id}:\nError: {error}")
+        else:
+            sections.append(format_dubbing_status(project_id, result))
+    
+    return TextContent(type="text", text="\n\n".join(sections))
 
 
 @mcp.tool(
@@ -461,82 +752,84 @@ def check_dubbing_status(
         TextContent containing the path to the downloaded file
     """
 )
-def download_dubbing_result(
+@api_tool("downloading result for project {project_id}", "Error downloading dubbing result")
+async def download_dubbing_result(
     project_id: str,
     output_directory: Optional[str] = None
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Downloading dubbing result for project {project_id}")
+    logger.info("[🤖 Speechlab] Downloading dubbing result for project %s", project_id)
     
-    try:
-        # First get project details to find the output media URL
-        project_response = custom_client.get(
-            f"{api_base_url}/projects/{project_id}",
-            params={"expand": "true"}
-        )
-        project_response.raise_for_status()
-        project_data = project_response.json()
+    # First get project details to find the output media URL
+    project_response = await _api_request(
+        "GET", f"/projects/{project_id}",
+        params={"expand": "true"}
+    )
+    project_response.raise_for_status()
+    project_data = orjson.loads(project_response.content)
+    
+    # Navigate the response structure to find the output media
+    translations = project_data.get("translations", [])
+    if not translations:
+        make_error("No translations found in the project.")
         
-        # Navigate the response structure to find the output media
-        translations = project_data.get("translations", [])
-        if not translations:
-            make_error("No translations found in the project.")
+    # Take the first dub across all translations with an output media URL
+    download_url = next(filter(None, map(_output_url, _iter_dubs(project_data))), None)
             
-        # Look through translations for dubs with media
-        download_url = None
-        for translation in translations:
-            dubs = translation.get("dub", [])
-            if not dubs:
-                continue
-                
-            for dub in dubs:
-                medias = dub.get("medias", [])
-                for media in medias:
-                    if media.get("operationType") == "OUTPUT" and media.get("presignedURL"):
-                        download_url = media.get("presignedURL")
-                        break
-                if download_url:
-                    break
-            if download_url:
-                break
-                
-        if not download_url:
-            # Try alternative API endpoint if structured search fails
-            url_response = custom_client.get(
-                f"{api_base_url}/projects/{project_id}/download"
-            )
-            url_response.raise_for_status()
-            url_data = url_response.json()
-            
-            if "url" not in url_data:
-                make_error("No download URL available. The dubbing may not be complete.")
-            
-            download_url = url_data["url"]
-        
-        # Download the file
-        logger.info(f"[🤖 Speechlab] Downloading from URL: {download_url}")
-        download_response = httpx.get(download_url)
-        download_response.raise_for_status()
-        
-        # Save the file
-        output_path = make_output_path(output_directory, base_path)
-        output_file_name = make_output_file("dub", f"project_{project_id}", output_path, "mp4")
-        
-        with open(output_path / output_file_name, "wb") as f:
-            f.write(download_response.content)
-        
-        logger.info(f"[🤖 Speechlab] ✅ Dubbing result downloaded to {output_path / output_file_name}")
-        
-        return TextContent(
-            type="text",
-            text=f"Dubbing result downloaded successfully.\nFile saved at: {output_path / output_file_name}"
+    if not download_url:
+        # Try alternative API endpoint if structured search fails
+        url_response = await _api_request(
+            "GET", f"/projects/{project_id}/download"
         )
+        url_response.raise_for_status()
+        url_data = orjson.loads(url_response.content)
         
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"downloading result for project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error downloading dubbing result: {e}")
-        make_error(f"Error downloading dubbing result: {str(e)}")
+        if "url" not in url_data:
+            make_error("No download URL available. The dubbing may not be complete.")
+        
+        download_url = url_data["url"]
+    
+    output_path = make_output_path(output_directory, base_path)
+    output_file_name = make_output_file("dub", f"project_{project_id}", output_path, "mp4")
+    
+    # Stream the file to disk in chunks so large videos are never held in memory.
+    # It goes to a .part file that is only renamed into place once complete,
+    # so a dropped connection never leaves a truncated video behind.
+    output_file_path = output_path / output_file_name
+    partial_file_path = output_file_path.with_name(f"{output_file_path.name}.part")
+    logger.info("[🤖 Speechlab] Downloading from URL: %s", download_url)
+    try:
+        async with download_client.stream("GET", download_url) as download_response:
+            if download_response.is_error:
+                await download_response.aread()  # Load the error body for reporting
+            download_response.raise_for_status()
+            
+            received = 0
+            with open(partial_file_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                async for chunk in download_response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    received += len(chunk)
+                f.flush()
+                # Flushing a large video to disk can take seconds, so do it in
+                # a worker thread rather than stalling other tool calls
+                await asyncio.get_running_loop().run_in_executor(None, os.fsync, f.fileno())
+            
+            # Content-Length counts encoded bytes, so only compare it with
+            # what was written when the body wasn't compressed
+            content_length = int(download_response.headers.get("Content-Length", 0))
+            encoded = download_response.headers.get("Content-Encoding", "identity") != "identity"
+            if content_length and not encoded and received != content_length:
+                make_error(f"Download incomplete: received {received} of {content_length} bytes")
+        os.replace(partial_file_path, output_file_path)
+    except BaseException:
+        partial_file_path.unlink(missing_ok=True)
+        raise
+    
+    logger.info("[🤖 Speechlab] ✅ Dubbing result downloaded to %s", output_path / output_file_name)
+    
+    return TextContent(
+        type="text",
+        text=f"Dubbing result downloaded successfully.\nFile saved at: {output_path / output_file_name}"
+    )
 
 
 @mcp.tool(
@@ -549,42 +842,51 @@ def download_dubbing_result(
         TextContent containing the sharing link
     """
 )
-def generate_sharing_link(
+@api_tool("generating sharing link for project {project_id}", "Error generating sharing link")
+async def generate_sharing_link(
     project_id: str
 ) -> TextContent:
-    logger.info(f"[🤖 Speechlab] Generating sharing link for project {project_id}")
+    logger.info("[🤖 Speechlab] Generating sharing link for project %s", project_id)
     
-    try:
-        response = custom_client.post(
-            f"{api_base_url}/collaborations/generateSharingLink",
-            json={"projectId": project_id}
-        )
-        response.raise_for_status()
-        link_data = response.json()
-        
-        if "link" not in link_data:
-            make_error("No sharing link was returned in the response.")
-            
-        sharing_link = link_data["link"]
-        logger.info(f"[🤖 Speechlab] ✅ Generated sharing link: {sharing_link}")
-        
-        return TextContent(
-            type="text",
-            text=f"Sharing link generated successfully for project {project_id}.\nLink: {sharing_link}\n\nThis link can be shared with others to view the project."
-        )
+    response = await _api_request(
+        "POST", "/collaborations/generateSharingLink",
+        headers=_JSON_HEADERS,
+        content=orjson.dumps({"projectId": project_id})
+    )
+    response.raise_for_status()
+    link_data = orjson.loads(response.content)
+    
+    if "link" not in link_data:
+        make_error("No sharing link was returned in the response.")
         
-    except httpx.HTTPStatusError as e:
-        handle_api_error(e, f"generating sharing link for project {project_id}")
-        make_error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        logger.error(f"[🤖 Speechlab] ❌ Error generating sharing link: {e}")
-        make_error(f"Error generating sharing link: {str(e)}")
+    sharing_link = link_data["link"]
+    logger.info("[🤖 Speechlab] ✅ Generated sharing link: %s", sharing_link)
+    
+    return TextContent(
+        type="text",
+        text=f"Sharing link generated successfully for project {project_id}.\nLink: {sharing_link}\n\nThis link can be shared with others to view the project."
+    )
+
+
+async def serve() -> None:
+    """
+    Run the MCP server over stdio, closing the shared HTTP clients once it stops.
+    
+    The clients are closed here rather than in a FastMCP lifespan, which is
+    entered for every session: with the HTTP transports the first client to
+    disconnect would close them for everyone.
+    """
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await custom_client.aclose()
+        await download_client.aclose()
 
 
 def main():
     logger.info("[🤖 Speechlab] Starting Speechlab MCP server")
     """Run the MCP server"""
-    mcp.run()
+    asyncio.run(serve())
 
 
 if __name__ == "__main__":
@@ -1,15 +1,31 @@
 import os
+import stat
+import functools
 from pathlib import Path
-from datetime import datetime
+import time
+import types
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the entry points (the server, the examples and
+# the setup script), not by this library module
 logger = logging.getLogger(__name__)
 
+# Timestamp format used in output file names
+_TS_FMT = "%Y%m%d_%H%M%S"
+
+# Download directory used when the caller doesn't give one
+_DEFAULT_OUTPUT = Path.home() / "Desktop"
+
+# Language codes the API expects in place of the ones users give. Shared by
+# the server and the client so aliases are added in one place.
+LANGUAGE_ALIASES = types.MappingProxyType({"es": "es_la"})
+
+# File extensions accepted as media for upload
+MEDIA_EXTENSIONS = frozenset({
+    ".mp3", ".wav", ".m4a", ".aac", ".ogg", ".flac",
+    ".mp4", ".mov", ".avi", ".mkv", ".webm"
+})
+
 
 class SpeechlabMcpError(Exception):
     pass
@@ -20,11 +36,10 @@ def make_error(error_text: str):
     raise SpeechlabMcpError(error_text)
 
 
-def is_file_writeable(path: Path) -> bool:
-    if path.exists():
-        return os.access(path, os.W_OK)
-    parent_dir = path.parent
-    return os.access(parent_dir, os.W_OK)
+@functools.lru_cache(maxsize=64)
+def _expand(path_str: str) -> Path:
+    """Expand a leading ~ in a user-supplied directory."""
+    return Path(os.path.expanduser(path_str))
 
 
 def make_output_file(
@@ -32,7 +47,7 @@ def make_output_file(
 ) -> Path:
     id = text if full_id else text[:5]
 
-    output_file_name = f"{tool}_{id.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    output_file_name = f"{tool}_{id.replace(' ', '_')}_{time.strftime(_TS_FMT)}.{extension}"
     return output_path / output_file_name
 
 
@@ -41,14 +56,19 @@ def make_output_path(
 ) -> Path:
     output_path = None
     if output_directory is None:
-        output_path = Path.home() / "Desktop"
+        output_path = _DEFAULT_OUTPUT
     elif not os.path.isabs(output_directory) and base_path:
-        output_path = Path(os.path.expanduser(base_path)) / Path(output_directory)
+        output_path = _expand(base_path) / output_directory
     else:
-        output_path = Path(os.path.expanduser(output_directory))
-    if not is_file_writeable(output_path):
+        output_path = _expand(output_directory)
+    # mkdir fails if the directory can't be created; an existing one only
+    # needs its write permission checked
+    try:
+        output_path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        make_error(f"Directory ({output_path}) is not writeable: {e}")
+    if not os.access(output_path, os.W_OK):
         make_error(f"Directory ({output_path}) is not writeable")
-    output_path.mkdir(parents=True, exist_ok=True)
     return output_path
 
 
@@ -58,23 +78,21 @@ def handle_input_file(file_path: str, audio_content_check: bool = True) -> Path:
         make_error(
             "File path must be an absolute path if SPEECHLAB_MCP_BASE_PATH is not set"
         )
-    path = Path(file_path)
-    if not path.exists():
-        make_error(f"File ({path}) does not exist")
-    elif not path.is_file():
-        make_error(f"Path ({path}) is not a file")
+    # One stat call answers both the existence and the regular file checks
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        make_error(f"File ({file_path}) does not exist")
+    if not stat.S_ISREG(st.st_mode):
+        make_error(f"Path ({file_path}) is not a file")
 
     # Add audio file check if needed
     if audio_content_check:
-        if not check_media_file(path):
-            make_error(f"File ({path}) is not a recognized media file")
-    return path
+        if not check_media_file(file_path):
+            make_error(f"File ({file_path}) is not a recognized media file")
+    return Path(file_path)
 
 
-def check_media_file(path: Path) -> bool:
+def check_media_file(path: str | Path) -> bool:
     """Check if file is a recognized media file type."""
-    media_extensions = {
-        ".mp3", ".wav", ".m4a", ".aac", ".ogg", ".flac",
-        ".mp4", ".mov", ".avi", ".mkv", ".webm"
-    }
-    return path.suffix.lower() in media_extensions 
\ No newline at end of file
+    return os.path.splitext(path)[1].lower() in MEDIA_EXTENSIONS 
\ No newline at end of file
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the SpeechlabClient, using a mock HTTP transport.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from speechlab_mcp.client import SpeechlabClient
+
+
+class TestSpeechlabClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Give each test its own connection pools, so closing its clients
+        # can't close a pool shared with anything else
+        patcher = mock.patch.multiple(SpeechlabClient, _shared_clients={}, _shared_refcounts={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_client(self, handler, download_handler=None) -> SpeechlabClient:
+        """Create a client whose API and download requests are answered by the handlers."""
+        client = SpeechlabClient(api_key="test-key", base_url="http://speechlab.test/v1")
+        # Replace the client's pool with one using the mock transport; the
+        # mock is closed by the client's aclose and the unused original here
+        self.addAsyncCleanup(client.client.aclose)
+        client.client = SpeechlabClient._shared_clients[client._pool_key] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        if download_handler is not None:
+            self.addAsyncCleanup(client.download_client.aclose)
+            client.download_client = httpx.AsyncClient(transport=httpx.MockTransport(download_handler))
+        return client
+
+    async def test_create_project(self):
+        """Test that create_project posts the mapped language codes."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"projectId": "abc"})
+
+        async with self.make_client(handler) as client:
+            project = await client.create_project("Test", "en", "es")
+
+        self.assertEqual(project, {"projectId": "abc"})
+        payload = json.loads(requests[0].content)
+        self.assertEqual(payload["sourceLanguage"], "en")
+        self.assertEqual(payload["targetLanguage"], "es_la")
+        self.assertEqual(payload["dubAccent"], "es_la")
+
+    async def test_upload_media_streams_file(self):
+        """Test that uploads are streamed with a Content-Length from the file size."""
+        data = os.urandom(200 * 1024)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "video.mp4")
+            with open(path, "wb") as f:
+                f.write(data)
+
+            async with self.make_client(handler) as client:
+                await client.upload_media("abc", path)
+
+        request = requests[0]
+        self.assertNotIn("Transfer-Encoding", request.headers)
+        self.assertEqual(int(request.headers["Content-Length"]), len(request.content))
+        self.assertIn(data, request.content)
+
+    async def test_get_status_many(self):
+        """Test that statuses come back in the order the IDs were given."""
+
+        def handler(request):
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        async with self.make_client(handler) as client:
+            statuses = await client.get_status_many(["a", "b", "c"])
+
+        self.assertEqual([status["id"] for status in statuses], ["a", "b", "c"])
+
+    async def test_get_status_many_cancels_on_failure(self):
+        """Test that one failed status request cancels the others."""
+        cancelled = []
+
+        async def handler(request):
+            if request.url.path.endswith("/bad"):
+                return httpx.Response(404)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(request.url.path)
+                raise
+
+        async with self.make_client(handler) as client:
+            with self.assertRaises(httpx.HTTPStatusError):
+                await client.get_status_many(["slow", "bad"])
+
+        self.assertEqual(cancelled, ["/v1/projects/slow"])
+
+    async def test_wait_for_completion(self):
+        """Test that polling stops once the project is complete."""
+        statuses = iter(["PROCESSING", "COMPLETE"])
+
+        def handler(request):
+            return httpx.Response(200, json={"job": {"status": next(statuses)}})
+
+        async with self.make_client(handler) as client:
+            completed = await client.wait_for_completion("abc", max_attempts=3, delay_seconds=0)
+
+        self.assertTrue(completed)
+
+    async def test_failed_download_leaves_no_file(self):
+        """Test that a download cut off part way doesn't leave a file behind."""
+
+        class DroppedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"x" * 1000
+                raise httpx.ReadError("connection dropped")
+
+        def handler(request):
+            return httpx.Response(200, json={"translations": [{"dub": [{"medias": [
+                {"operationType": "OUTPUT", "presignedURL": "http://storage.test/out.mp4"}
+            ]}]}]})
+
+        def download_handler(request):
+            return httpx.Response(200, headers={"Content-Length": "10000000"}, stream=DroppedStream())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            async with self.make_client(handler, download_handler) as client:
+                with self.assertRaises(httpx.ReadError):
+                    await client.download_result("p", tmp)
+
+            self.assertEqual(os.listdir(tmp), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
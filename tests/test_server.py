@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP server's request handling, using a mock HTTP transport.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+# The server module refuses to import without an API key
+os.environ.setdefault("SPEECHLAB_API_KEY", "test-key")
+
+from speechlab_mcp import server
+from speechlab_mcp.utils import SpeechlabMcpError
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    """Create a client whose requests are answered by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestServerClient(unittest.TestCase):
+    def test_api_transport_pool_settings(self):
+        """Test that the API transport is built with HTTP/2 and the tuned limits."""
+        self.assertEqual(server.API_POOL_LIMITS.max_connections, 50)
+        self.assertEqual(server.API_POOL_LIMITS.max_keepalive_connections, 50)
+        self.assertEqual(server.API_POOL_LIMITS.keepalive_expiry, 60.0)
+
+        with mock.patch.object(server.httpx, "AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as transport:
+            server._api_transport()
+
+        _, kwargs = transport.call_args
+        self.assertTrue(kwargs["http2"])
+        self.assertIs(kwargs["limits"], server.API_POOL_LIMITS)
+
+
+class TestServerRequests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        server._project_cache.clear()
+
+    async def test_rate_limited_request_is_retried(self):
+        """Test that a 429 is retried after the server's Retry-After."""
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"job": {"status": "COMPLETE"}}),
+        ])
+
+        with mock.patch.object(server, "custom_client", mock_client(lambda request: next(responses))):
+            status = await server.get_dubbing_status("abc")
+
+        self.assertEqual(status["status"], "COMPLETE")
+
+    async def test_retries_are_limited(self):
+        """Test that the last response is returned once the attempts run out."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503, headers={"Retry-After": "0"})
+
+        with mock.patch.object(server, "custom_client", mock_client(handler)):
+            response = await server._api_request("GET", "/projects/abc")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(requests), server.MAX_REQUEST_ATTEMPTS)
+
+    async def test_post_is_not_retried_on_gateway_error(self):
+        """Test that a POST the API may have acted on is not sent again."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(502)
+
+        with mock.patch.object(server, "custom_client", mock_client(handler)):
+            response = await server._api_request("POST", "/projects/abc/dub")
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(len(requests), 1)
+
+    async def test_concurrent_project_fetches_are_coalesced(self):
+        """Test that concurrent status checks of one project share a request."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"job": {"status": "PROCESSING"}})
+
+        with mock.patch.object(server, "custom_client", mock_client(handler)):
+            statuses = await asyncio.gather(
+                server.get_dubbing_status("abc"),
+                server.get_dubbing_status("abc"),
+            )
+
+        self.assertEqual([status["status"] for status in statuses], ["PROCESSING"] * 2)
+        self.assertEqual(len(requests), 1)
+
+    async def test_fetch_in_flight_during_change_is_not_cached(self):
+        """Test that a project changed mid-fetch is fetched again afterwards."""
+        entered, release = asyncio.Event(), asyncio.Event()
+        statuses = iter(["CREATED", "PROCESSING"])
+
+        async def handler(request):
+            status = next(statuses)
+            if status == "CREATED":
+                entered.set()
+                await release.wait()
+            return httpx.Response(200, json={"job": {"status": status}})
+
+        with mock.patch.object(server, "custom_client", mock_client(handler)):
+            stale = asyncio.ensure_future(server.get_dubbing_status("abc"))
+            await entered.wait()
+            server._invalidate_project("abc")
+            release.set()
+            await stale
+            status = await server.get_dubbing_status("abc")
+
+        self.assertEqual(status["status"], "PROCESSING")
+
+    async def test_serve_closes_clients_on_exit(self):
+        """Test that the shared clients are closed once the server stops."""
+        api_client, download_client = mock_client(None), mock_client(None)
+
+        with mock.patch.object(server, "custom_client", api_client), \
+                mock.patch.object(server, "download_client", download_client), \
+                mock.patch.object(server.mcp, "run_stdio_async", mock.AsyncMock()):
+            await server.serve()
+
+        self.assertTrue(api_client.is_closed)
+        self.assertTrue(download_client.is_closed)
+
+    async def test_failed_download_leaves_no_file(self):
+        """Test that a download cut off part way doesn't leave a file behind."""
+
+        class DroppedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"x" * 1000
+                raise httpx.ReadError("connection dropped")
+
+        def handler(request):
+            return httpx.Response(200, json={"translations": [{"dub": [{"medias": [
+                {"operationType": "OUTPUT", "presignedURL": "http://storage.test/out.mp4"}
+            ]}]}]})
+
+        def download_handler(request):
+            return httpx.Response(200, headers={"Content-Length": "10000000"}, stream=DroppedStream())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(server, "custom_client", mock_client(handler)), \
+                    mock.patch.object(server, "download_client", mock_client(download_handler)):
+                with self.assertRaises(SpeechlabMcpError):
+                    await server.download_dubbing_result("abc", tmp)
+
+            self.assertEqual(os.listdir(tmp), [])
+
+
+if __name__ == "__main__":
+    unittest.main()